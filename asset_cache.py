@@ -0,0 +1,184 @@
+import os
+import sys
+import atexit
+import struct
+import hashlib
+from multiprocessing import shared_memory, resource_tracker
+
+import pygame
+
+NAMESPACE_ENV = "ARCADE_ASSET_CACHE"
+BUDGET_ENV = "ARCADE_ASSET_CACHE_MB"
+NAMESPACE_PREFIX = "arcade"
+SHM_DIRECTORY = "/dev/shm"
+
+HEADER = struct.Struct("<4sIIBB")
+MAGIC = b"ARC2"
+
+# BGRA on little-endian hosts has the same masks as convert_alpha() and convert(),
+# so mapped surfaces blit on the fast path without ever being copied into display
+# format. Opaque surfaces use the same layout with per-pixel alpha switched off.
+NATIVE_FORMAT = "BGRA" if sys.byteorder == "little" else "ARGB"
+ALPHA, OPAQUE = 0, 1
+
+
+def _untrack(segment):
+    # Before 3.13 the resource tracker unlinks every segment a process touched when
+    # it exits, which would tear the cache down whenever a game quits.
+    try:
+        resource_tracker.unregister(segment._name, "shared_memory")
+    except Exception:
+        pass
+
+
+def _process_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True
+    return True
+
+
+def purge_stale_segments():
+    if not os.path.isdir(SHM_DIRECTORY):
+        return 0
+    purged = 0
+    for filename in os.listdir(SHM_DIRECTORY):
+        if not filename.startswith(NAMESPACE_PREFIX):
+            continue
+        owner = filename[len(NAMESPACE_PREFIX):].split("_", 1)[0]
+        if owner.isdigit() and not _process_alive(int(owner)):
+            try:
+                os.remove(os.path.join(SHM_DIRECTORY, filename))
+                purged += 1
+            except OSError:
+                pass
+    return purged
+
+
+class SharedAssetCache:
+    def __init__(self, namespace=None, budget_mb=None):
+        self.namespace = namespace or os.environ.get(NAMESPACE_ENV) or f"{NAMESPACE_PREFIX}{os.getpid()}"
+        if budget_mb is None:
+            budget_mb = int(os.environ.get(BUDGET_ENV, "256") or 256)
+        self.budget_bytes = budget_mb * 1024 * 1024
+        self.published_bytes = 0
+        self.segments = {}
+        self.surfaces = {}
+        self.created = []
+
+    @property
+    def is_owner(self):
+        return self.namespace == f"{NAMESPACE_PREFIX}{os.getpid()}"
+
+    def export_environment(self, environment):
+        environment[NAMESPACE_ENV] = self.namespace
+        return environment
+
+    def _segment_name(self, key):
+        return f"{self.namespace}_{hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]}"
+
+    def _map(self, key, segment):
+        magic, width, height, format_index, ready = HEADER.unpack_from(segment.buf)
+        if magic != MAGIC or not ready or format_index not in (ALPHA, OPAQUE):
+            return None
+        pixels = segment.buf[HEADER.size:HEADER.size + width * height * 4]
+        surface = pygame.image.frombuffer(pixels, (width, height), NATIVE_FORMAT)
+        if format_index == OPAQUE:
+            surface.set_alpha(None)
+        self.segments[key] = segment
+        self.surfaces[key] = surface
+        return surface
+
+    def get(self, key):
+        if key in self.surfaces:
+            return self.surfaces[key]
+        try:
+            segment = shared_memory.SharedMemory(name=self._segment_name(key))
+        except (FileNotFoundError, OSError, ValueError):
+            return None
+        _untrack(segment)
+
+        surface = self._map(key, segment)
+        if surface is None:
+            segment.close()
+        return surface
+
+    def publish(self, key, surface, opaque=False):
+        existing = self.get(key)
+        if existing is not None:
+            return existing
+
+        width, height = surface.get_size()
+        size = HEADER.size + width * height * 4
+        if self.published_bytes + size > self.budget_bytes:
+            return surface
+
+        try:
+            segment = shared_memory.SharedMemory(name=self._segment_name(key), create=True, size=size)
+        except FileExistsError:
+            return self.get(key) or surface
+        except OSError:
+            return surface
+        _untrack(segment)
+        self.created.append(segment.name)
+        self.published_bytes += size
+
+        segment.buf[HEADER.size:size] = pygame.image.tobytes(surface, NATIVE_FORMAT)
+        HEADER.pack_into(segment.buf, 0, MAGIC, width, height, OPAQUE if opaque else ALPHA, 1)
+        return self._map(key, segment) or surface
+
+    def get_or_load(self, key, loader, opaque=False):
+        surface = self.get(key)
+        if surface is not None:
+            return surface
+        surface = loader()
+        if surface is None:
+            return None
+        return self.publish(key, surface, opaque)
+
+    def release(self):
+        self.surfaces.clear()
+        for segment in self.segments.values():
+            try:
+                segment.close()
+            except BufferError:
+                # A surface outside the cache still maps this segment; let the mapping
+                # die with it instead of failing again in SharedMemory.__del__.
+                segment._buf = None
+                segment._mmap = None
+        self.segments.clear()
+
+        if not self.is_owner:
+            return
+        names = set(self.created)
+        if os.path.isdir(SHM_DIRECTORY):
+            names.update(name for name in os.listdir(SHM_DIRECTORY) if name.startswith(self.namespace + "_"))
+        for name in names:
+            try:
+                segment = shared_memory.SharedMemory(name=name)
+            except (FileNotFoundError, OSError):
+                continue
+            segment.close()
+            try:
+                segment.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def file_key(kind, filepath):
+    stat = os.stat(filepath)
+    return f"{kind}:{os.path.abspath(filepath)}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+_cache = None
+
+
+def get_cache():
+    global _cache
+    if _cache is None:
+        _cache = SharedAssetCache()
+        atexit.register(_cache.release)
+    return _cache
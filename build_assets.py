@@ -0,0 +1,215 @@
+import os
+import sys
+import json
+import glob
+import time
+import hashlib
+import argparse
+import importlib.util
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+ROOT_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+GAMES_DIRECTORY = os.path.join(ROOT_DIRECTORY, "games")
+BUILD_DIRECTORY_NAME = "build"
+MANIFEST_FILENAME = "manifest.json"
+BUILD_VERSION = 1
+COVER_FILENAMES = ("cover.png", "cover.jpg", "cover.jpeg", "cover.webp")
+
+
+def hash_files(*paths, extra=""):
+    digest = hashlib.sha256(f"v{BUILD_VERSION}:{extra}".encode("utf-8"))
+    for path in paths:
+        with open(path, "rb") as source_file:
+            digest.update(source_file.read())
+    return digest.hexdigest()[:16]
+
+
+def build_directory(game_path):
+    return os.path.join(game_path, BUILD_DIRECTORY_NAME)
+
+
+def load_manifest(game_path):
+    try:
+        with open(os.path.join(build_directory(game_path), MANIFEST_FILENAME), "r", encoding="utf-8") as manifest_file:
+            manifest = json.load(manifest_file)
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def save_manifest(game_path, manifest):
+    manifest_path = os.path.join(build_directory(game_path), MANIFEST_FILENAME)
+    temporary_path = manifest_path + ".tmp"
+    with open(temporary_path, "w", encoding="utf-8") as manifest_file:
+        json.dump(manifest, manifest_file, indent=2, sort_keys=True)
+    os.replace(temporary_path, manifest_path)
+
+
+def find_artifact(game_path, name, source_hash, manifest=None):
+    if manifest is None:
+        manifest = load_manifest(game_path)
+    entry = manifest.get(name)
+    if not entry or entry.get("hash") != source_hash:
+        return None
+    artifact_path = os.path.join(build_directory(game_path), entry["file"])
+    return artifact_path if os.path.isfile(artifact_path) else None
+
+
+def find_cover(game_path):
+    for filename in COVER_FILENAMES:
+        cover_filepath = os.path.join(game_path, filename)
+        if os.path.isfile(cover_filepath):
+            return cover_filepath
+    return None
+
+
+def cover_artifact_name(width, height, radius):
+    return f"card-{width}x{height}-r{radius}"
+
+
+def cover_hash(cover_filepath, width, height, radius):
+    return hash_files(cover_filepath, extra=cover_artifact_name(width, height, radius))
+
+
+def _init_worker():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    if ROOT_DIRECTORY not in sys.path:
+        sys.path.insert(0, ROOT_DIRECTORY)
+
+    import pygame
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+
+
+def _load_game_module(game_path):
+    module_name = "game_" + os.path.basename(game_path)
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, os.path.join(game_path, "main.py"))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+    return module
+
+
+def _build_card(game_path, source_path, output_path, width, height, radius):
+    import pygame
+    import launcher
+    image = launcher.load_cover_image(source_path)
+    if image is None:
+        raise ValueError(f"cannot decode {source_path}")
+    pygame.image.save(launcher.render_rounded_image(image, (width, height), radius), output_path)
+
+
+def _build_level(game_path, source_path, output_path):
+    game = _load_game_module(game_path)
+    level = game.compile_level(game.load_level_rows(source_path))
+    with open(output_path, "w", encoding="utf-8") as output_file:
+        json.dump(level, output_file, separators=(",", ":"))
+
+
+BUILDERS = {
+    "card": _build_card,
+    "level": _build_level,
+}
+
+
+def _run_task(kind, game_path, source_path, output_path, options):
+    started_at = time.perf_counter()
+    temporary_path = output_path + ".tmp" + os.path.splitext(output_path)[1]
+    BUILDERS[kind](game_path, source_path, temporary_path, **options)
+    os.replace(temporary_path, output_path)
+    return time.perf_counter() - started_at
+
+
+def collect_tasks(game_path, card_specs):
+    tasks = []
+
+    cover_filepath = find_cover(game_path)
+    if cover_filepath:
+        for width, height, radius in card_specs:
+            name = cover_artifact_name(width, height, radius)
+            tasks.append((name, cover_hash(cover_filepath, width, height, radius), "card", cover_filepath, ".png",
+                          {"width": width, "height": height, "radius": radius}))
+
+    script_path = os.path.join(game_path, "main.py")
+    for level_path in sorted(glob.glob(os.path.join(game_path, "levels", "*.txt"))):
+        name = os.path.splitext(os.path.basename(level_path))[0]
+        tasks.append(("level-" + name, hash_files(level_path, script_path), "level", level_path, ".json", {}))
+
+    return tasks
+
+
+def build(games_directory=GAMES_DIRECTORY, jobs=None, force=False):
+    import launcher
+    card_specs = launcher.baked_cover_specs(launcher.SCREEN_WIDTH)
+    started_at = time.perf_counter()
+
+    game_paths = [os.path.join(games_directory, slug) for slug in sorted(os.listdir(games_directory))]
+    game_paths = [path for path in game_paths if os.path.isfile(os.path.join(path, "main.py"))]
+
+    manifests = {}
+    pending = []
+    up_to_date = 0
+
+    for game_path in game_paths:
+        os.makedirs(build_directory(game_path), exist_ok=True)
+        manifest = load_manifest(game_path)
+        manifests[game_path] = {}
+
+        for name, source_hash, kind, source_path, extension, options in collect_tasks(game_path, card_specs):
+            if not force and find_artifact(game_path, name, source_hash, manifest):
+                manifests[game_path][name] = manifest[name]
+                up_to_date += 1
+                continue
+            filename = f"{name}-{source_hash}{extension}"
+            output_path = os.path.join(build_directory(game_path), filename)
+            pending.append((game_path, name, {"hash": source_hash, "file": filename},
+                            (kind, game_path, source_path, output_path, options)))
+
+    failures = []
+    if pending:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as pool:
+            futures = {pool.submit(_run_task, *task): (game_path, name, entry)
+                       for game_path, name, entry, task in pending}
+            for future in as_completed(futures):
+                game_path, name, entry = futures[future]
+                slug = os.path.basename(game_path)
+                try:
+                    duration = future.result()
+                except Exception as error:
+                    failures.append((slug, name, error))
+                    print(f"[BUILD] {slug}/{name} FAILED: {error}")
+                    continue
+                manifests[game_path][name] = entry
+                print(f"[BUILD] {slug}/{name} ({duration * 1000:.0f} ms)")
+
+    for game_path, manifest in manifests.items():
+        save_manifest(game_path, manifest)
+        referenced = {entry["file"] for entry in manifest.values()} | {MANIFEST_FILENAME}
+        for filename in os.listdir(build_directory(game_path)):
+            if filename not in referenced:
+                os.remove(os.path.join(build_directory(game_path), filename))
+
+    built = len(pending) - len(failures)
+    print(f"[BUILD] {built} built, {up_to_date} up to date, {len(failures)} failed "
+          f"in {time.perf_counter() - started_at:.2f} s")
+    return not failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Precompute runtime-ready artifacts for every game.")
+    parser.add_argument("--games", default=GAMES_DIRECTORY, help="games directory to walk")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="rebuild even if artifacts are up to date")
+    args = parser.parse_args(argv)
+    return 0 if build(args.games, args.jobs, args.force) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
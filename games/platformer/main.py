@@ -1,9 +1,27 @@
 import sys
 import os
+import glob
+import json
 import math
 import random
+import struct
 import pygame
-
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT_DIRECTORY = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if ROOT_DIRECTORY not in sys.path:
+    sys.path.insert(0, ROOT_DIRECTORY)
+
+import telemetry
+import supervisor
+import profiler
+import quality
+import sound
+import build_assets
+import asset_cache
+
+sound.pre_init()
 pygame.init()
 
 WINDOW_WIDTH = 960
@@ -20,11 +38,7 @@ COLOR_GOLD = (245, 200, 80)
 COLOR_SPIKE = (220, 60, 60)
 COLOR_GREEN = (70, 200, 120)
 
-screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
-pygame.display.set_caption("Red Runner")
-clock = pygame.time.Clock()
-
-
+@lru_cache(maxsize=None)
 def get_font(size):
     return pygame.font.Font(None, size)
 
@@ -36,27 +50,18 @@ def draw_rounded_rect(surface, rect, color, radius=0, width=0):
         pygame.draw.rect(surface, color, rect, width)
 
 
-LEVEL_DATA = [
-    "................................................................................",
-    "................................................................................",
-    ".................................................c............E.................",
-    ".................................................XXX............................",
-    "...................c............................................c...............",
-    "..............XXX..XXX..............c...............E...........XXX.............",
-    "@..................................XXXXX...........................c............",
-    "XXXX.................====....................................XXXXXXX............",
-    "....XX....c..............................................c...........c..........",
-    "......XX..............................................XXXXXXX...................",
-    ".........XX..............!.......................c......................G.......",
-    "............XX.....^^^^^XXXXXX..............XXXXXXX.............^^^^^XXXXXX.....",
-    "...............XX....................c..........................................",
-    "..................XX................XXXXXXX.....................................",
-    ".....................XX........................................................",
-    "........................XXXXXXXXXXXX.............................||||...........",
-    ".................................................................||||...........",
-    "..................c....................c.........................||||...........",
-    "XXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXX",
-]
+LEVEL_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "levels")
+LEVEL_PATH = os.path.join(LEVEL_DIRECTORY, "01.txt")
+LEVEL_PATHS = sorted(glob.glob(os.path.join(LEVEL_DIRECTORY, "*.txt"))) or [LEVEL_PATH]
+PRELOAD_DISTANCE = TILE_SIZE * 10
+
+
+def load_level_rows(path):
+    with open(path, "r", encoding="utf-8") as level_file:
+        return [line.rstrip("\n") for line in level_file if line.strip()]
+
+
+LEVEL_DATA = load_level_rows(LEVEL_PATH)
 
 TILE_SOLID = {"X"}
 TILE_COIN = {"c"}
@@ -77,12 +82,12 @@ class InputHandler:
         if pygame.joystick.get_count() > joy_index:
             self.joy = pygame.joystick.Joystick(joy_index)
             self.joy.init()
-            print("[GAME] Using joystick:", self.joy.get_name(), 
-                  "axes:", self.joy.get_numaxes(), 
-                  "buttons:", self.joy.get_numbuttons(), 
-                  "hats:", self.joy.get_numhats())
+            telemetry.emit("joystick", name=self.joy.get_name(),
+                           axes=self.joy.get_numaxes(),
+                           buttons=self.joy.get_numbuttons(),
+                           hats=self.joy.get_numhats())
         else:
-            print("[GAME] No joystick detected.")
+            telemetry.emit("joystick", name=None)
             
         self.btn_prev = {}
         self.hat_prev = (0, 0)
@@ -92,11 +97,14 @@ class InputHandler:
         self.right_prev = False
         self.jump_prev = False
         self.back_prev = False
+        self.restart_prev = False
         
         self.left_now = False
         self.right_now = False
         self.jump_now = False
         self.back_now = False
+        self.rewind_now = False
+        self.restart_now = False
 
     def _get_button(self, i):
         return self.joy and self.joy.get_numbuttons() > i and self.joy.get_button(i)
@@ -106,12 +114,15 @@ class InputHandler:
         self.right_prev = self.right_now
         self.jump_prev = self.jump_now
         self.back_prev = self.back_now
+        self.restart_prev = self.restart_now
         
         if not self.joy:
             self.left_now = False
             self.right_now = False
             self.jump_now = False
             self.back_now = False
+            self.rewind_now = False
+            self.restart_now = False
             return
 
         num_buttons = self.joy.get_numbuttons()
@@ -119,7 +130,7 @@ class InputHandler:
             val = bool(self.joy.get_button(b))
             prev_val = self.btn_prev.get(b, False)
             if val != prev_val:
-                print("[GAME] BUTTON", b, "DOWN" if val else "UP")
+                telemetry.emit("button", index=b, state="DOWN" if val else "UP")
             self.btn_prev[b] = val
 
         hat = (0, 0)
@@ -127,12 +138,12 @@ class InputHandler:
             hat = self.joy.get_hat(0)
             
         if hat != self.hat_prev:
-            print("[GAME] HAT0 ->", hat)
+            telemetry.emit("hat", index=0, value=hat)
         self.hat_prev = hat
 
         ax0 = self.joy.get_axis(0) if self.joy.get_numaxes() > 0 else 0.0
         if abs(ax0 - self.ax0_prev) >= 0.1 or ax0 in (-1.0, 0.0, 1.0):
-            print("[GAME] AXIS0 %+.2f" % ax0)
+            telemetry.emit("axis", index=0, value=round(ax0, 2))
         self.ax0_prev = ax0
 
         x_dir = hat[0]
@@ -146,6 +157,8 @@ class InputHandler:
         self.right_now = (x_dir > 0)
         self.jump_now = bool(self._get_button(0))
         self.back_now = bool(self._get_button(1) or self._get_button(7))
+        self.rewind_now = bool(self._get_button(2))
+        self.restart_now = bool(self._get_button(3))
 
     def left(self):
         return self.left_now
@@ -156,19 +169,28 @@ class InputHandler:
     def jump_pressed(self):
         val = self.jump_now and not self.jump_prev
         if val:
-            print("[GAME] ACTION JUMP PRESSED")
+            telemetry.emit("action", name="JUMP")
         return val
 
     def jump_released(self):
         val = (not self.jump_now) and self.jump_prev
         if val:
-            print("[GAME] ACTION JUMP RELEASED")
+            telemetry.emit("action", name="JUMP_RELEASED")
         return val
 
     def back_pressed(self):
         val = self.back_now and not self.back_prev
         if val:
-            print("[GAME] ACTION BACK PRESSED")
+            telemetry.emit("action", name="BACK")
+        return val
+
+    def rewind_held(self):
+        return self.rewind_now
+
+    def restart_pressed(self):
+        val = self.restart_now and not self.restart_prev
+        if val:
+            telemetry.emit("action", name="RESTART")
         return val
 
 
@@ -200,7 +222,7 @@ class Camera:
         offset_x = 0
         offset_y = 0
         
-        if self.shake_time > 0:
+        if self.shake_time > 0 and quality.current().screen_shake:
             current_mag = self.shake_magnitude * self.shake_time
             offset_x = random.uniform(-current_mag, current_mag)
             offset_y = random.uniform(-current_mag, current_mag)
@@ -272,12 +294,32 @@ class Enemy:
         self.rect = pygame.Rect(x, y, TILE_SIZE - 8, TILE_SIZE - 8)
         self.vx = 120
         self.direction = 1
+        self.remainder_x = 0.0
 
     def update(self, dt, solids):
-        self.rect.x += int(self.vx * self.direction * dt)
-        if get_solid_collision(self.rect, solids):
-            self.direction *= -1
-            self.rect.x += int(self.vx * self.direction * dt)
+        self.remainder_x += self.vx * self.direction * dt
+        step = int(self.remainder_x)
+        self.remainder_x -= step
+        if step == 0:
+            return
+            
+        hit = sweep_first_hit(self.rect, step, 0, solids)
+        if hit is None:
+            self.rect.x += step
+            if get_solid_collision(self.rect, solids):
+                self.rect.x -= step
+                self.direction *= -1
+            return
+            
+        toi, normal_x, normal_y, contact = hit
+        if normal_x < 0:
+            self.rect.right = contact.left
+        elif normal_x > 0:
+            self.rect.left = contact.right
+        else:
+            self.rect.x += int(step * toi)
+        self.direction *= -1
+        self.remainder_x = 0.0
 
     def draw(self, surface, camera):
         render_rect = camera.apply(self.rect)
@@ -290,6 +332,8 @@ class Player:
         self.rect = pygame.Rect(x, y, 32, 42)
         self.vx = 0.0
         self.vy = 0.0
+        self.remainder_x = 0.0
+        self.remainder_y = 0.0
         self.on_ground = False
         self.coyote_time = 0.0
         self.jump_buffer = 0.0
@@ -337,8 +381,9 @@ class Player:
             self.vy = -360
             self.on_ground = False
             self.jump_buffer = 0
+            sound.play("jump")
             
-            for _ in range(8):
+            for _ in range(quality.particles(8)):
                 angle = random.uniform(-0.4, 0.4)
                 speed = random.uniform(80, 160)
                 particles.append(Particle(
@@ -353,11 +398,11 @@ class Player:
         self.vy += 1000 * dt
         self.vy = max(-1000, min(980, self.vy))
 
-        self.move_x(self.vx * dt, solids)
+        self.move_x(self.vx * dt, solids, platforms)
         self.apply_platform_x(platforms)
         
-        self.move_y(self.vy * dt, solids)
         self.on_ground = False
+        self.move_y(self.vy * dt, solids, platforms)
         self.apply_platform_y(platforms)
         
         self.collect_items(coins, particles)
@@ -374,29 +419,74 @@ class Player:
                 
         return None
 
-    def move_x(self, dx, solids):
-        self.rect.x += int(dx)
-        hit = get_solid_collision(self.rect, solids)
-        
-        if hit:
-            if dx > 0:
-                self.rect.right = hit.left
-            elif dx < 0:
-                self.rect.left = hit.right
+    def move_x(self, dx, solids, platforms=()):
+        self.remainder_x += dx
+        step = int(self.remainder_x)
+        self.remainder_x -= step
+        if step == 0:
+            return
+            
+        hit = sweep_first_hit(self.rect, step, 0, solids, platforms)
+        if hit is None:
+            self.rect.x += step
+        else:
+            toi, normal_x, normal_y, contact = hit
+            if normal_x < 0:
+                self.rect.right = contact.left
+            elif normal_x > 0:
+                self.rect.left = contact.right
+            else:
+                self.rect.x += int(step * toi)
+            if normal_x:
+                self.vx = 0
+                self.remainder_x = 0.0
+                
+        overlap = get_solid_collision(self.rect, solids + [p.rect for p in platforms])
+        if overlap:
+            if step > 0:
+                self.rect.right = overlap.left
+            else:
+                self.rect.left = overlap.right
             self.vx = 0
+            self.remainder_x = 0.0
 
-    def move_y(self, dy, solids):
-        self.rect.y += int(dy)
-        hit = get_solid_collision(self.rect, solids)
+    def move_y(self, dy, solids, platforms=()):
+        blocking = solids + [p.rect for p in platforms]
+        self.remainder_y += dy
+        step = int(self.remainder_y)
+        self.remainder_y -= step
         
-        if hit:
-            if dy > 0:
-                self.rect.bottom = hit.top
-                self.vy = 0
-                self.on_ground = True
-            elif dy < 0:
-                self.rect.top = hit.bottom
+        if step != 0:
+            hit = sweep_first_hit(self.rect, 0, step, solids, platforms)
+            if hit is None:
+                self.rect.y += step
+            else:
+                toi, normal_x, normal_y, contact = hit
+                if normal_y < 0:
+                    self.rect.bottom = contact.top
+                    self.on_ground = True
+                elif normal_y > 0:
+                    self.rect.top = contact.bottom
+                else:
+                    self.rect.y += int(step * toi)
+                if normal_y:
+                    self.vy = 0
+                    self.remainder_y = 0.0
+                    
+            overlap = get_solid_collision(self.rect, blocking)
+            if overlap:
+                if step > 0:
+                    self.rect.bottom = overlap.top
+                    self.on_ground = True
+                else:
+                    self.rect.top = overlap.bottom
                 self.vy = 0
+                self.remainder_y = 0.0
+                
+        if self.vy >= 0 and not self.on_ground and get_solid_collision(self.rect.move(0, 1), blocking):
+            self.on_ground = True
+            self.vy = 0
+            self.remainder_y = 0.0
 
     def apply_platform_x(self, platforms):
         for p in platforms:
@@ -411,7 +501,15 @@ class Player:
     def apply_platform_y(self, platforms):
         carried_by = None
         for p in platforms:
-            if p.delta.y != 0 and self.rect.colliderect(p.rect):
+            # A rising platform moves before the player, so its rider is left standing
+            # anywhere between the old top and the new one (or below it on a long step).
+            if (p.delta.y < 0 and p.rect.left < self.rect.right and self.rect.left < p.rect.right
+                    and p.rect.top <= self.rect.bottom <= p.prev_rect.top + 8):
+                self.rect.bottom = p.rect.top
+                self.vy = 0
+                self.on_ground = True
+                carried_by = p
+            elif p.delta.y != 0 and self.rect.colliderect(p.rect):
                 if p.delta.y > 0 and self.rect.bottom <= p.rect.top + 8:
                     self.rect.bottom = p.rect.top
                     self.vy = 0
@@ -429,9 +527,10 @@ class Player:
         while i < len(coins):
             if self.rect.colliderect(coins[i]):
                 self.coins += 1
+                sound.play("coin")
                 cx, cy = coins[i].center
                 
-                for _ in range(12):
+                for _ in range(quality.particles(12)):
                     angle = random.uniform(0, math.tau)
                     speed = random.uniform(90, 180)
                     particles.append(Particle(
@@ -445,10 +544,12 @@ class Player:
                 i += 1
 
     def die(self, camera, particles):
+        telemetry.emit("death", x=self.rect.x, y=self.rect.y)
+        sound.play("death")
         camera.add_shake(8, 0.2)
         cx, cy = self.rect.center
         
-        for _ in range(20):
+        for _ in range(quality.particles(20)):
             angle = random.uniform(0, math.tau)
             speed = random.uniform(120, 240)
             particles.append(Particle(
@@ -459,6 +560,8 @@ class Player:
             
         self.vx = 0
         self.vy = 0
+        self.remainder_x = 0.0
+        self.remainder_y = 0.0
         self.rect.topleft = (int(self.checkpoint.x), int(self.checkpoint.y))
 
 
@@ -469,18 +572,205 @@ def get_solid_collision(rect, solids):
     return None
 
 
-def parse_level_data(rows):
-    solids = []
-    coins = []
-    spikes = []
-    enemies = []
-    platforms = []
-    goal = []
-    checkpoints = []
-    spawn_pos = (64, 64)
+def _sweep_axis(moving_min, moving_max, obstacle_min, obstacle_max, velocity):
+    if velocity > 0:
+        return (obstacle_min - moving_max) / velocity, (obstacle_max - moving_min) / velocity
+    if velocity < 0:
+        return (obstacle_max - moving_min) / velocity, (obstacle_min - moving_max) / velocity
+    if moving_max <= obstacle_min or moving_min >= obstacle_max:
+        return None, None
+    return -math.inf, math.inf
+
+
+def sweep_aabb(rect, dx, dy, obstacle, obstacle_dx=0.0, obstacle_dy=0.0):
+    # Returns (time_of_impact, normal_x, normal_y) for the first contact within this
+    # step, or None. Rects that already overlap are left to the overlap fallback.
+    relative_dx = dx - obstacle_dx
+    relative_dy = dy - obstacle_dy
+    
+    entry_x, exit_x = _sweep_axis(rect.left, rect.right, obstacle.left, obstacle.right, relative_dx)
+    if entry_x is None:
+        return None
+    entry_y, exit_y = _sweep_axis(rect.top, rect.bottom, obstacle.top, obstacle.bottom, relative_dy)
+    if entry_y is None:
+        return None
+        
+    entry = max(entry_x, entry_y)
+    if entry > min(exit_x, exit_y) or entry < 0.0 or entry >= 1.0:
+        return None
+        
+    if entry_x > entry_y:
+        return entry, (-1 if relative_dx > 0 else 1), 0
+    return entry, 0, (-1 if relative_dy > 0 else 1)
+
+
+def sweep_first_hit(rect, dx, dy, solids, platforms=()):
+    if dx == 0 and dy == 0:
+        return None
+        
+    swept_bounds = rect.union(rect.move(dx, dy))
+    first_hit = None
+    
+    for r in solids:
+        if not swept_bounds.colliderect(r):
+            continue
+        hit = sweep_aabb(rect, dx, dy, r)
+        if hit and (first_hit is None or hit[0] < first_hit[0]):
+            first_hit = (*hit, r)
+            
+    for p in platforms:
+        start = p.prev_rect
+        if not swept_bounds.colliderect(start.union(p.rect)):
+            continue
+        delta = p.delta
+        hit = sweep_aabb(rect, dx, dy, start, delta.x, delta.y)
+        if hit and (first_hit is None or hit[0] < first_hit[0]):
+            contact = start.move(int(delta.x * hit[0]), int(delta.y * hit[0]))
+            first_hit = (*hit, contact)
+            
+    return first_hit
+
+
+class WorldState:
+    # Packs everything that affects simulation into one fixed-size struct so that
+    # snapshots can be written into preallocated buffers without creating objects.
+    # Particles are cosmetic and are not captured.
+    PLAYER_FORMAT = "iidddd?ddbidd"
+    CAMERA_FORMAT = "dddd"
+    ENEMY_FORMAT = "iibd"
+    PLATFORM_FORMAT = "diiii"
+    
+    def __init__(self, player, camera, coins, enemies, platforms):
+        self.player = player
+        self.camera = camera
+        self.coins = coins
+        self.all_coins = list(coins)
+        self.coin_indices = {id(c): i for i, c in enumerate(self.all_coins)}
+        self.enemies = enemies
+        self.platforms = platforms
+        self.coin_flags = bytearray(len(self.all_coins))
+        self.no_coins = bytes(len(self.all_coins))
+        self.format = struct.Struct("<I" + self.PLAYER_FORMAT + self.CAMERA_FORMAT
+                                    + self.ENEMY_FORMAT * len(enemies)
+                                    + self.PLATFORM_FORMAT * len(platforms)
+                                    + "%ds" % len(self.all_coins))
+        
+    @property
+    def size(self):
+        return self.format.size
+        
+    def capture_into(self, buffer, offset=0, frame=0):
+        player = self.player
+        camera = self.camera
+        
+        flags = self.coin_flags
+        flags[:] = self.no_coins
+        for c in self.coins:
+            flags[self.coin_indices[id(c)]] = 1
+            
+        values = [frame,
+                  player.rect.x, player.rect.y, player.vx, player.vy, player.remainder_x, player.remainder_y,
+                  player.on_ground, player.coyote_time, player.jump_buffer, player.facing,
+                  player.coins, player.checkpoint.x, player.checkpoint.y,
+                  camera.x, camera.y, camera.shake_time, camera.shake_magnitude]
+        for e in self.enemies:
+            values += (e.rect.x, e.rect.y, e.direction, e.remainder_x)
+        for p in self.platforms:
+            values += (p.time, p.rect.x, p.rect.y, p.prev_rect.x, p.prev_rect.y)
+        values.append(flags)
+        
+        self.format.pack_into(buffer, offset, *values)
+        
+    def snapshot(self, frame=0):
+        buffer = bytearray(self.size)
+        self.capture_into(buffer, 0, frame)
+        return buffer
+        
+    def restore_from(self, buffer, offset=0):
+        values = self.format.unpack_from(buffer, offset)
+        player = self.player
+        camera = self.camera
+        
+        (frame, player.rect.x, player.rect.y, player.vx, player.vy, player.remainder_x, player.remainder_y,
+         player.on_ground, player.coyote_time, player.jump_buffer, player.facing,
+         player.coins, checkpoint_x, checkpoint_y,
+         camera.x, camera.y, camera.shake_time, camera.shake_magnitude) = values[:18]
+        player.checkpoint.update(checkpoint_x, checkpoint_y)
+        
+        index = 18
+        for e in self.enemies:
+            e.rect.x, e.rect.y, e.direction, e.remainder_x = values[index:index + 4]
+            index += 4
+        for p in self.platforms:
+            p.time, p.rect.x, p.rect.y, p.prev_rect.x, p.prev_rect.y = values[index:index + 5]
+            index += 5
+            
+        flags = values[index]
+        self.coins[:] = [c for c, alive in zip(self.all_coins, flags) if alive]
+        return frame
+        
+    def restore(self, snapshot):
+        return self.restore_from(snapshot, 0)
+
+
+class RewindBuffer:
+    def __init__(self, world_state, capacity=FPS * 10):
+        self.world_state = world_state
+        self.capacity = capacity
+        self.slot_size = world_state.size
+        self.data = bytearray(self.slot_size * capacity)
+        self.head = 0
+        self.count = 0
+        
+    def __len__(self):
+        return self.count
+        
+    def clear(self):
+        self.head = 0
+        self.count = 0
+        
+    def push(self, frame):
+        self.world_state.capture_into(self.data, self.head * self.slot_size, frame)
+        self.head = (self.head + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+        
+    def _slot_offset(self, frames_back):
+        return ((self.head - 1 - frames_back) % self.capacity) * self.slot_size
+        
+    def frame_at(self, frames_back):
+        return struct.unpack_from("<I", self.data, self._slot_offset(frames_back))[0]
+        
+    def seek(self, frames_back):
+        if not 0 <= frames_back < self.count:
+            return None
+        return self.world_state.restore_from(self.data, self._slot_offset(frames_back))
+        
+    def seek_frame(self, frame):
+        if self.count == 0:
+            return None
+        frames_back = self.frame_at(0) - frame
+        if 0 <= frames_back < self.count and self.frame_at(frames_back) == frame:
+            return self.seek(frames_back)
+        return None
+        
+    def rewind(self):
+        if self.count == 0:
+            return None
+        frame = self.seek(0)
+        self.head = (self.head - 1) % self.capacity
+        self.count -= 1
+        return frame
+
+
+def compile_level(rows):
+    level = {
+        "solids": [], "coins": [], "spikes": [], "enemies": [], "platforms": [],
+        "goal": [], "checkpoints": [], "spawn": [64, 64],
+    }
     
     level_height = len(rows)
     level_width_tiles = max((len(r) for r in rows), default=0)
+    level["size"] = [level_width_tiles * TILE_SIZE, level_height * TILE_SIZE]
     
     for y in range(level_height):
         line = rows[y].ljust(level_width_tiles, ".")
@@ -489,40 +779,97 @@ def parse_level_data(rows):
             ry = y * TILE_SIZE
             
             if char in TILE_SOLID:
-                solids.append(pygame.Rect(rx, ry, TILE_SIZE, TILE_SIZE))
+                level["solids"].append([rx, ry, TILE_SIZE, TILE_SIZE])
             elif char in TILE_COIN:
-                coins.append(pygame.Rect(rx + TILE_SIZE // 3, ry + TILE_SIZE // 3, TILE_SIZE // 3, TILE_SIZE // 3))
+                level["coins"].append([rx + TILE_SIZE // 3, ry + TILE_SIZE // 3, TILE_SIZE // 3, TILE_SIZE // 3])
             elif char in TILE_SPIKES:
-                spikes.append(pygame.Rect(rx, ry + TILE_SIZE // 2, TILE_SIZE, TILE_SIZE // 2))
+                level["spikes"].append([rx, ry + TILE_SIZE // 2, TILE_SIZE, TILE_SIZE // 2])
             elif char in TILE_PLATFORM_H:
-                platforms.append(Platform(rx, ry, TILE_SIZE, TILE_SIZE // 3, 1, 0, 80, 1.2))
+                level["platforms"].append([rx, ry, TILE_SIZE, TILE_SIZE // 3, 1, 0, 80, 1.2])
             elif char in TILE_PLATFORM_V:
-                platforms.append(Platform(rx + 6, ry, TILE_SIZE - 12, TILE_SIZE // 3, 0, 1, 90, 1.0))
+                level["platforms"].append([rx + 6, ry, TILE_SIZE - 12, TILE_SIZE // 3, 0, 1, 90, 1.0])
             elif char in TILE_SPAWN:
-                spawn_pos = (rx, ry - 12)
+                level["spawn"] = [rx, ry - 12]
             elif char in TILE_GOAL:
-                goal.append(pygame.Rect(rx, ry, TILE_SIZE, TILE_SIZE))
+                level["goal"].append([rx, ry, TILE_SIZE, TILE_SIZE])
             elif char in TILE_CHECKPOINT:
-                checkpoints.append(pygame.Rect(rx, ry, TILE_SIZE, TILE_SIZE))
+                level["checkpoints"].append([rx, ry, TILE_SIZE, TILE_SIZE])
             elif char == "E":
-                enemies.append(Enemy(rx + 6, ry + 8))
+                level["enemies"].append([rx + 6, ry + 8])
                 
-    return solids, coins, spikes, enemies, platforms, goal, checkpoints, (level_width_tiles * TILE_SIZE, level_height * TILE_SIZE), spawn_pos
+    return level
 
 
-def draw_game_world(surface, camera, solids, coins, spikes, enemies, platforms, goal, checkpoints):
-    for r in solids:
-        pygame.draw.rect(surface, COLOR_GROUND, camera.apply(r))
+def build_level(level):
+    solids = [pygame.Rect(r) for r in level["solids"]]
+    coins = [pygame.Rect(r) for r in level["coins"]]
+    spikes = [pygame.Rect(r) for r in level["spikes"]]
+    enemies = [Enemy(x, y) for x, y in level["enemies"]]
+    platforms = [Platform(*params) for params in level["platforms"]]
+    goal = [pygame.Rect(r) for r in level["goal"]]
+    checkpoints = [pygame.Rect(r) for r in level["checkpoints"]]
+    
+    return solids, coins, spikes, enemies, platforms, goal, checkpoints, tuple(level["size"]), tuple(level["spawn"])
+
+
+def parse_level_data(rows):
+    return build_level(compile_level(rows))
+
+
+def bake_static_layer(level):
+    layer = pygame.Surface(level["size"])
+    layer.fill(COLOR_DARK)
+    
+    for r in level["solids"]:
+        pygame.draw.rect(layer, COLOR_GROUND, r)
+        
+    for r in map(pygame.Rect, level["spikes"]):
+        points = [(r.left, r.bottom), (r.centerx, r.top), (r.right, r.bottom)]
+        pygame.draw.polygon(layer, COLOR_SPIKE, points)
+        pygame.draw.polygon(layer, (255, 200, 200), points, 2)
+        
+    for r in level["goal"]:
+        pygame.draw.rect(layer, COLOR_GREEN, r)
+        pygame.draw.rect(layer, COLOR_WHITE, r, 2)
+        
+    for r in level["checkpoints"]:
+        pygame.draw.rect(layer, (100, 180, 255), r)
+        pygame.draw.rect(layer, COLOR_WHITE, r, 2)
+        
+    return layer
+
+
+def load_level(level_path):
+    source_hash = build_assets.hash_files(level_path, __file__)
+    game_path = os.path.dirname(os.path.dirname(level_path))
+    name = os.path.splitext(os.path.basename(level_path))[0]
+    
+    level = None
+    compiled_path = build_assets.find_artifact(game_path, "level-" + name, source_hash)
+    if compiled_path:
+        try:
+            with open(compiled_path, "r", encoding="utf-8") as compiled_file:
+                level = json.load(compiled_file)
+        except (OSError, ValueError):
+            level = None
+    if level is None:
+        level = compile_level(load_level_rows(level_path))
+        
+    def bake():
+        static_layer = bake_static_layer(level)
+        return static_layer.convert() if pygame.display.get_surface() is not None else static_layer
+        
+    static_layer = asset_cache.get_cache().get_or_load("layer:" + source_hash, bake, opaque=True)
         
+    return build_level(level), static_layer
+
+
+def draw_game_world(surface, camera, static_layer, coins, enemies, platforms):
+    surface.blit(static_layer, camera.apply(static_layer.get_rect()).topleft)
+    
     for p in platforms:
         p.draw(surface, camera)
         
-    for r in spikes:
-        render_rect = camera.apply(r)
-        points = [(render_rect.left, render_rect.bottom), (render_rect.centerx, render_rect.top), (render_rect.right, render_rect.bottom)]
-        pygame.draw.polygon(surface, COLOR_SPIKE, points)
-        pygame.draw.polygon(surface, (255, 200, 200), points, 2)
-        
     for r in coins:
         render_rect = camera.apply(r)
         pygame.draw.circle(surface, COLOR_GOLD, render_rect.center, render_rect.width // 2)
@@ -530,16 +877,51 @@ def draw_game_world(surface, camera, solids, coins, spikes, enemies, platforms,
         
     for e in enemies:
         e.draw(surface, camera)
-        
-    for r in goal:
-        render_rect = camera.apply(r)
-        pygame.draw.rect(surface, COLOR_GREEN, render_rect)
-        pygame.draw.rect(surface, COLOR_WHITE, render_rect, 2)
-        
-    for r in checkpoints:
-        render_rect = camera.apply(r)
-        pygame.draw.rect(surface, (100, 180, 255), render_rect)
-        pygame.draw.rect(surface, COLOR_WHITE, render_rect, 2)
+
+
+class LevelPreloader:
+    # Loads at most one level at a time on a worker thread, so by the time the player
+    # clears the current one its rects, entities and static layer are already built.
+    def __init__(self):
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="level-preload")
+        self.futures = {}
+
+    def request(self, level_path):
+        if level_path not in self.futures:
+            self.futures[level_path] = self.executor.submit(load_level, level_path)
+
+    def take(self, level_path):
+        self.request(level_path)
+        future = self.futures.pop(level_path)
+        if not future.done():
+            telemetry.emit("level_stall", level=os.path.basename(level_path))
+        return future.result()
+
+
+def near_goal(rect, goal, distance=PRELOAD_DISTANCE):
+    return any(math.hypot(rect.centerx - r.centerx, rect.centery - r.centery) < distance for r in goal)
+
+
+def enter_level(level, coins=0):
+    spawn_pos = level[8]
+    player = Player(spawn_pos[0], spawn_pos[1])
+    player.coins = coins
+    camera = Camera()
+    world_state = WorldState(player, camera, level[1], level[3], level[4])
+    return player, camera, world_state, RewindBuffer(world_state)
+
+
+@lru_cache(maxsize=None)
+def get_win_overlay(title, hint):
+    overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
+    overlay.fill((0, 0, 0, 160))
+    
+    title_text = get_font(64).render(title, True, COLOR_WHITE)
+    hint_text = get_font(24).render(hint, True, COLOR_GRAY)
+    
+    overlay.blit(title_text, (WINDOW_WIDTH // 2 - title_text.get_width() // 2, WINDOW_HEIGHT // 2 - 60))
+    overlay.blit(hint_text, (WINDOW_WIDTH // 2 - hint_text.get_width() // 2, WINDOW_HEIGHT // 2 + 10))
+    return overlay
 
 
 def draw_hud(surface, player):
@@ -547,71 +929,153 @@ def draw_hud(surface, player):
     surface.blit(text_surface, (16, 12))
 
 
+def step_simulation(dt, input_handler, level, player, camera, particles):
+    solids, coins, spikes, enemies, platforms, goal, checkpoints, level_size, _ = level
+    
+    for p in platforms:
+        p.update(dt)
+        
+    platform_rects = [p.rect for p in platforms]
+    combined_solids = solids + platform_rects
+    
+    for en in enemies:
+        en.update(dt, combined_solids)
+        
+    with profiler.scope("player"):
+        game_state = player.update(dt, input_handler, solids, platforms, coins, spikes, enemies, goal, checkpoints, camera, particles)
+        
+    camera.update(player.rect, level_size[0], level_size[1])
+    return game_state
+
+
 def run_game():
-    solids, coins, spikes, enemies, platforms, goal, checkpoints, level_size, spawn_pos = parse_level_data(LEVEL_DATA)
+    telemetry.start("platformer", tag="GAME")
+    profiler.configure("platformer")
+    quality.configure()
+    sound.configure(os.path.join(os.path.dirname(os.path.abspath(__file__)), "sounds"), ("jump", "coin", "death", "level_clear"))
+    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    pygame.display.set_caption("Red Runner")
+    clock = pygame.time.Clock()
     
-    player = Player(spawn_pos[0], spawn_pos[1])
-    camera = Camera()
+    level_index = 0
+    level, static_layer = load_level(LEVEL_PATHS[level_index])
+    solids, coins, spikes, enemies, platforms, goal, checkpoints, level_size, spawn_pos = level
+    preloader = LevelPreloader()
+    
+    player, camera, world_state, rewind_buffer = enter_level(level)
     particles = []
     input_handler = InputHandler(joy_index=0, deadzone=0.35)
+    has_won = False
+    level_cleared = False
+    
+    checkpoint_snapshot = world_state.snapshot()
+    frame_number = 0
     
     while True:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+        with profiler.scope("input"):
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    pygame.quit()
+                    sys.exit()
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_F12:
+                    profiler.request_capture()
+                    
+            supervisor.heartbeat()
+            input_handler.update()
+            profiler.poll_combo(input_handler.joy)
+        
+        if input_handler.back_pressed():
+            if has_won or not supervisor.can_suspend():
                 pygame.quit()
                 sys.exit()
                 
-        input_handler.update()
-        
-        if input_handler.back_pressed():
-            pygame.quit()
-            sys.exit()
+            pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.HIDDEN)
+            if not supervisor.suspend():
+                pygame.quit()
+                sys.exit()
+                
+            screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SHOWN)
+            pygame.event.clear()
+            clock.tick()
+            quality.reset()
             
-        dt = clock.tick(FPS) / 1000.0
+        with profiler.scope("tick"):
+            frame_ms = clock.tick(FPS)
+            quality.record(frame_ms, clock.get_rawtime())
+            dt = frame_ms / 1000.0
         
-        for p in platforms:
-            p.update(dt)
+        next_path = LEVEL_PATHS[level_index + 1] if level_index + 1 < len(LEVEL_PATHS) else None
+        if next_path and (level_cleared or near_goal(player.rect, goal)):
+            preloader.request(next_path)
             
-        platform_rects = [p.rect for p in platforms]
-        combined_solids = solids + platform_rects
-        
-        for en in enemies:
-            en.update(dt, combined_solids)
+        if input_handler.restart_pressed() and not level_cleared:
+            frame_number = world_state.restore(checkpoint_snapshot)
+            rewind_buffer.clear()
+            particles.clear()
             
-        game_state = player.update(dt, input_handler, combined_solids, platforms, coins, spikes, enemies, goal, checkpoints, camera, particles)
-        
-        camera.update(player.rect, level_size[0], level_size[1])
-        
-        screen.fill(COLOR_DARK)
-        draw_game_world(screen, camera, solids, coins, spikes, enemies, platforms, goal, checkpoints)
-        
-        player_render_rect = camera.apply(player.rect)
-        draw_rounded_rect(screen, player_render_rect, COLOR_ACCENT, 8)
-        pygame.draw.rect(screen, COLOR_WHITE, player_render_rect, 2)
-        
-        i = 0
-        while i < len(particles):
-            if particles[i].update(dt):
-                particles[i].draw(screen, camera)
-                i += 1
+        with profiler.scope("entities"):
+            if level_cleared and next_path:
+                game_state = "win"
+                if input_handler.jump_pressed():
+                    level_index += 1
+                    level, static_layer = preloader.take(next_path)
+                    solids, coins, spikes, enemies, platforms, goal, checkpoints, level_size, spawn_pos = level
+                    player, camera, world_state, rewind_buffer = enter_level(level, player.coins)
+                    checkpoint_snapshot = world_state.snapshot()
+                    frame_number = 0
+                    particles.clear()
+                    level_cleared = False
+                    game_state = None
+            elif input_handler.rewind_held() and len(rewind_buffer) > 0:
+                frame_number = rewind_buffer.rewind()
+                game_state = None
             else:
-                particles.pop(i)
+                checkpoint_before = tuple(player.checkpoint)
+                game_state = step_simulation(dt, input_handler, level, player, camera, particles)
                 
-        draw_hud(screen, player)
+                frame_number += 1
+                if tuple(player.checkpoint) != checkpoint_before:
+                    checkpoint_snapshot = world_state.snapshot(frame_number)
+                rewind_buffer.push(frame_number)
         
-        if game_state == "win":
-            overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 160))
-            screen.blit(overlay, (0, 0))
+        with profiler.scope("draw_game_world"):
+            screen.fill(COLOR_DARK)
+            draw_game_world(screen, camera, static_layer, coins, enemies, platforms)
             
-            win_text = get_font(64).render("You Win!", True, COLOR_WHITE)
-            exit_text = get_font(24).render("Press B/Start to exit", True, COLOR_GRAY)
+            player_render_rect = camera.apply(player.rect)
+            draw_rounded_rect(screen, player_render_rect, COLOR_ACCENT, 8)
+            pygame.draw.rect(screen, COLOR_WHITE, player_render_rect, 2)
+        
+        with profiler.scope("particles"):
+            i = 0
+            while i < len(particles):
+                if particles[i].update(dt):
+                    particles[i].draw(screen, camera)
+                    i += 1
+                else:
+                    particles.pop(i)
+                
+        with profiler.scope("text"):
+            draw_hud(screen, player)
             
-            screen.blit(win_text, (WINDOW_WIDTH // 2 - win_text.get_width() // 2, WINDOW_HEIGHT // 2 - 60))
-            screen.blit(exit_text, (WINDOW_WIDTH // 2 - exit_text.get_width() // 2, WINDOW_HEIGHT // 2 + 10))
+            if game_state == "win":
+                if next_path:
+                    if not level_cleared:
+                        level_cleared = True
+                        sound.play("level_clear")
+                        telemetry.emit("level_clear", level=os.path.basename(LEVEL_PATHS[level_index]),
+                                       coins=player.coins)
+                    screen.blit(get_win_overlay("Level Clear!", "Press A to continue"), (0, 0))
+                else:
+                    if not has_won:
+                        has_won = True
+                        sound.play("level_clear")
+                        telemetry.emit("win", coins=player.coins)
+                    screen.blit(get_win_overlay("You Win!", "Press B/Start to exit"), (0, 0))
             
-        pygame.display.flip()
-
+        with profiler.scope("flip"):
+            pygame.display.flip()
+        profiler.frame_end()
 
 if __name__ == "__main__":
     run_game()
\ No newline at end of file
@@ -0,0 +1,273 @@
+import os
+import sys
+import glob
+import json
+import time
+import random
+import argparse
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+GAME_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+if GAME_DIRECTORY not in sys.path:
+    sys.path.insert(0, GAME_DIRECTORY)
+
+import main as game
+
+DEFAULT_SIMS = 2000
+DEFAULT_SECONDS = 60
+DEFAULT_STUCK_SECONDS = 8
+SIM_DT = 1.0 / game.FPS
+CHUNK_SIZE = 50
+
+
+class ScriptedInput:
+    # Same queries as InputHandler, fed from a per-frame "LRJ" string instead of a pad.
+    def __init__(self):
+        self.buttons = ""
+        self.jump_prev = False
+
+    def set(self, buttons):
+        self.jump_prev = "J" in self.buttons
+        self.buttons = buttons
+
+    def left(self):
+        return "L" in self.buttons
+
+    def right(self):
+        return "R" in self.buttons
+
+    def jump_pressed(self):
+        return "J" in self.buttons and not self.jump_prev
+
+    def jump_released(self):
+        return "J" not in self.buttons and self.jump_prev
+
+    def back_pressed(self):
+        return False
+
+    def rewind_held(self):
+        return False
+
+    def restart_pressed(self):
+        return False
+
+
+class SimPlayer(game.Player):
+    def __init__(self, x, y):
+        super().__init__(x, y)
+        self.deaths = 0
+
+    def die(self, camera, particles):
+        self.deaths += 1
+        super().die(camera, particles)
+
+
+def random_inputs(seed):
+    # Holds a direction for a while and taps or holds jump at random, biased toward
+    # running right so most runs get deep into the level.
+    rng = random.Random(seed)
+    while True:
+        direction = rng.choices(("R", "L", ""), weights=(6, 2, 2))[0]
+        for _ in range(rng.randint(6, 60)):
+            if rng.random() < 0.06:
+                for _ in range(rng.randint(1, 24)):
+                    yield direction + "J"
+            yield direction
+
+
+def scripted_inputs(script):
+    for buttons, frames in script:
+        for _ in range(frames):
+            yield buttons
+    while True:
+        yield ""
+
+
+def load_script(script_path):
+    with open(script_path, "r", encoding="utf-8") as script_file:
+        script = json.load(script_file)
+    return [(str(buttons).upper(), int(frames)) for buttons, frames in script]
+
+
+def tile_of(rect):
+    return rect.centerx // game.TILE_SIZE, rect.centery // game.TILE_SIZE
+
+
+def simulate(level_data, inputs, max_frames, stuck_frames, dt=SIM_DT):
+    level = game.build_level(level_data)
+    solids, coins, spikes, enemies, platforms, goal, checkpoints, level_size, spawn_pos = level
+    bounds = game.pygame.Rect(0, 0, level_size[0], level_size[1])
+    coin_index = {tuple(r): i for i, r in enumerate(coins)}
+
+    player = SimPlayer(spawn_pos[0], spawn_pos[1])
+    camera = game.Camera()
+    particles = []
+    input_handler = ScriptedInput()
+
+    visited = {tile_of(player.rect)}
+    window = player.rect.copy()
+    window_start = 0
+    result = {"won": False, "frames": 0, "deaths": 0, "failure": None}
+
+    for frame in range(1, max_frames + 1):
+        input_handler.set(next(inputs))
+        checkpoint = tuple(player.checkpoint)
+        remaining = len(coins)
+
+        game_state = game.step_simulation(dt, input_handler, level, player, camera, particles)
+        particles.clear()
+
+        visited.add(tile_of(player.rect))
+        result["frames"] = frame
+
+        if game_state == "win":
+            result["won"] = True
+            break
+        if not player.rect.colliderect(bounds):
+            result["failure"] = f"out of bounds at {player.rect.topleft}"
+            break
+
+        window.union_ip(player.rect)
+        if len(coins) != remaining or tuple(player.checkpoint) != checkpoint:
+            window, window_start = player.rect.copy(), frame
+        elif frame - window_start >= stuck_frames:
+            if window.width < game.TILE_SIZE * 2 and window.height < game.TILE_SIZE * 2:
+                result["failure"] = f"stuck at {player.rect.topleft}"
+                break
+            window, window_start = player.rect.copy(), frame
+
+    result["deaths"] = player.deaths
+    result["visited"] = visited
+    result["coins"] = set(coin_index.values()) - {coin_index[tuple(r)] for r in coins}
+    return result
+
+
+def _run_seeds(level_data, seeds, max_frames, stuck_frames):
+    summary = {"sims": 0, "wins": 0, "frames": 0, "deaths": 0, "fastest_win": None,
+               "visited": set(), "coins": set(), "failures": []}
+    for seed in seeds:
+        try:
+            result = simulate(level_data, random_inputs(seed), max_frames, stuck_frames)
+        except Exception:
+            summary["failures"].append((seed, "error: " + traceback.format_exc(limit=4).strip().splitlines()[-1]))
+            summary["sims"] += 1
+            continue
+        summary["sims"] += 1
+        summary["frames"] += result["frames"]
+        summary["deaths"] += result["deaths"]
+        summary["visited"] |= result["visited"]
+        summary["coins"] |= result["coins"]
+        if result["won"]:
+            summary["wins"] += 1
+            if summary["fastest_win"] is None or result["frames"] < summary["fastest_win"][1]:
+                summary["fastest_win"] = (seed, result["frames"])
+        if result["failure"]:
+            summary["failures"].append((seed, result["failure"]))
+    return summary
+
+
+def _merge(total, summary):
+    for key in ("sims", "wins", "frames", "deaths"):
+        total[key] += summary[key]
+    total["visited"] |= summary["visited"]
+    total["coins"] |= summary["coins"]
+    total["failures"].extend(summary["failures"])
+    if summary["fastest_win"] and (total["fastest_win"] is None or summary["fastest_win"][1] < total["fastest_win"][1]):
+        total["fastest_win"] = summary["fastest_win"]
+
+
+def open_tiles(level_data):
+    width, height = level_data["size"]
+    solid = {(x // game.TILE_SIZE, y // game.TILE_SIZE) for x, y, _, _ in level_data["solids"]}
+    return {(x, y) for x in range(width // game.TILE_SIZE) for y in range(height // game.TILE_SIZE)} - solid
+
+
+def validate_level(level_path, sims, seed, seconds, stuck_seconds, jobs=None, max_failures=10):
+    level_data = game.compile_level(game.load_level_rows(level_path))
+    max_frames = int(seconds * game.FPS)
+    stuck_frames = max(1, int(stuck_seconds * game.FPS))
+    seeds = list(range(seed, seed + sims))
+    chunks = [seeds[i:i + CHUNK_SIZE] for i in range(0, len(seeds), CHUNK_SIZE)]
+
+    total = {"sims": 0, "wins": 0, "frames": 0, "deaths": 0, "fastest_win": None,
+             "visited": set(), "coins": set(), "failures": []}
+    started_at = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(_run_seeds, level_data, chunk, max_frames, stuck_frames) for chunk in chunks]
+        for future in as_completed(futures):
+            _merge(total, future.result())
+    elapsed = time.perf_counter() - started_at
+
+    name = os.path.relpath(level_path, GAME_DIRECTORY)
+    open_set = open_tiles(level_data)
+    visited = total["visited"] & open_set
+    unreached = sorted(set(range(len(level_data["coins"]))) - total["coins"])
+
+    print(f"[SIM] {name}: {total['sims']} sims, {total['frames']} frames in {elapsed:.2f} s "
+          f"({total['sims'] / elapsed:.0f} sims/s, {total['frames'] / elapsed:.0f} frames/s)")
+    print(f"[SIM] {name}: coverage {len(visited)}/{len(open_set)} open tiles "
+          f"({100.0 * len(visited) / max(1, len(open_set)):.1f}%), {total['deaths']} deaths")
+    if total["wins"]:
+        fastest_seed, fastest_frames = total["fastest_win"]
+        print(f"[SIM] {name}: goal reached in {total['wins']} sims "
+              f"(fastest seed {fastest_seed}, {fastest_frames / game.FPS:.1f} s)")
+    else:
+        print(f"[SIM] {name}: goal never reached")
+    for index in unreached:
+        x, y, _, _ = level_data["coins"][index]
+        print(f"[SIM] {name}: coin at tile {x // game.TILE_SIZE},{y // game.TILE_SIZE} never collected")
+
+    failures = sorted(total["failures"])
+    for failure_seed, reason in failures[:max_failures]:
+        print(f"[SIM] {name}: seed {failure_seed} FAILED: {reason}")
+    if len(failures) > max_failures:
+        print(f"[SIM] {name}: ... {len(failures) - max_failures} more failures")
+
+    return bool(total["wins"]) and not unreached and not failures
+
+
+def replay(level_path, inputs, seconds, stuck_seconds, label):
+    level_data = game.compile_level(game.load_level_rows(level_path))
+    result = simulate(level_data, inputs, int(seconds * game.FPS), max(1, int(stuck_seconds * game.FPS)))
+    outcome = "won" if result["won"] else (result["failure"] or "timed out")
+    print(f"[SIM] {label}: {outcome} after {result['frames']} frames, {result['deaths']} deaths, "
+          f"{len(result['coins'])}/{len(level_data['coins'])} coins, {len(result['visited'])} tiles")
+    return result["won"] and not result["failure"]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fuzz platformer levels headlessly across worker processes.")
+    parser.add_argument("levels", nargs="*", help="level files (default: every levels/*.txt)")
+    parser.add_argument("-n", "--sims", type=int, default=DEFAULT_SIMS, help="random input sequences per level")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--seed", type=int, default=0, help="first seed; sim i uses seed + i")
+    parser.add_argument("--seconds", type=float, default=DEFAULT_SECONDS, help="simulated time limit per run")
+    parser.add_argument("--stuck-seconds", type=float, default=DEFAULT_STUCK_SECONDS,
+                        help="flag a run that stays within two tiles for this long")
+    parser.add_argument("--replay", type=int, default=None, metavar="SEED", help="rerun a single seed")
+    parser.add_argument("--script", action="append", default=[],
+                        help='JSON list of ["LRJ", frames] steps to run instead of random input')
+    args = parser.parse_args(argv)
+
+    level_paths = args.levels or sorted(glob.glob(os.path.join(GAME_DIRECTORY, "levels", "*.txt")))
+    ok = True
+    for level_path in level_paths:
+        name = os.path.relpath(level_path, GAME_DIRECTORY)
+        if args.replay is not None:
+            ok &= replay(level_path, random_inputs(args.replay), args.seconds, args.stuck_seconds,
+                         f"{name} seed {args.replay}")
+        elif args.script:
+            for script_path in args.script:
+                ok &= replay(level_path, scripted_inputs(load_script(script_path)), args.seconds,
+                             args.stuck_seconds, f"{name} {os.path.basename(script_path)}")
+        else:
+            ok &= validate_level(level_path, args.sims, args.seed, args.seconds, args.stuck_seconds, args.jobs)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
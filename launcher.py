@@ -2,15 +2,31 @@ import os
 import sys
 import json
 import math
-import time
-import subprocess
 import pygame
-from typing import Optional, Tuple
-from dataclasses import dataclass
+import telemetry
+import profiler
+import quality
+import sound
+import build_assets
+import asset_cache
+from supervisor import GameSupervisor, SessionState
+from prewarm import Prewarmer
+from previews import PreviewPlayer, PreviewSource, find_preview
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+from dataclasses import dataclass, field
 from enum import Enum, auto
 
+sound.pre_init()
 pygame.init()
 
+SCREEN_WIDTH = 1180
+SCREEN_HEIGHT = 600
+# Games without a heartbeat cannot say when their window is up, so the loading
+# screen is held for this long and then handed over blind; a game that takes
+# longer to start leaves the display blank for the rest of its startup.
+MIN_LOADING_SECONDS = 1.5
+
 BACKGROUND_COLOR = (15, 16, 20)
 CARD_BACKGROUND_COLOR = (28, 29, 36)
 TEXT_COLOR_PRIMARY = (238, 239, 244)
@@ -22,7 +38,7 @@ def draw_rounded_rect(surface, rect, color, radius=0, width=0):
     except TypeError:
         pygame.draw.rect(surface, color, rect, width)
 
-def scale_to_cover(surface, target_size):
+def scale_to_cover(surface, target_size, smooth=True):
     image_width, image_height = surface.get_size()
     target_width, target_height = target_size
     
@@ -30,26 +46,65 @@ def scale_to_cover(surface, target_size):
     new_width = int(image_width * scale_factor)
     new_height = int(image_height * scale_factor)
     
-    return pygame.transform.smoothscale(surface, (new_width, new_height))
-
-def blit_rounded_image(destination_surface, image, rect, radius):
-    if not image:
-        draw_rounded_rect(destination_surface, rect, (40, 42, 50), radius)
-        return
-        
-    scaled_image = scale_to_cover(image, (rect.width, rect.height))
-    layer = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
+    if smooth:
+        return pygame.transform.smoothscale(surface, (new_width, new_height))
+    return pygame.transform.scale(surface, (new_width, new_height))
+
+def render_rounded_image(image, size, radius, smooth=True):
+    width, height = size
+    scaled_image = scale_to_cover(image, size, smooth)
+    layer = pygame.Surface(size, pygame.SRCALPHA)
     
-    x_offset = (rect.width - scaled_image.get_width()) // 2
-    y_offset = (rect.height - scaled_image.get_height()) // 2
+    x_offset = (width - scaled_image.get_width()) // 2
+    y_offset = (height - scaled_image.get_height()) // 2
     layer.blit(scaled_image, (x_offset, y_offset))
     
-    mask = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
+    mask = pygame.Surface(size, pygame.SRCALPHA)
     draw_rounded_rect(mask, mask.get_rect(), (255, 255, 255, 255), radius)
     
     layer.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-    destination_surface.blit(layer, rect.topleft)
+    return layer
+
+def blit_rounded_image(destination_surface, image, rect, radius, smooth=True):
+    if not image:
+        draw_rounded_rect(destination_surface, rect, (40, 42, 50), radius)
+        return
+        
+    destination_surface.blit(render_rounded_image(image, rect.size, radius, smooth), rect.topleft)
+
+def blit_cover(destination_surface, entry, rect, radius, smooth=True):
+    baked_cover = entry.baked_covers.get((rect.width, rect.height, radius))
+    if baked_cover:
+        destination_surface.blit(baked_cover, rect.topleft)
+    else:
+        blit_rounded_image(destination_surface, entry.cover, rect, radius, smooth)
+
+def hero_card_size(screen_width):
+    hero_width = int(min(screen_width * 0.50, 760))
+    return hero_width, int(hero_width * 0.60)
+
+def card_scale(distance):
+    return 0.62 + 0.38 * max(0.0, 1.0 - abs(distance) * 0.55)
+
+def side_image_rect(card_rect):
+    return card_rect.inflate(-14, -14)
 
+def focus_image_rect(card_rect, padding=16):
+    return pygame.Rect(card_rect.x + padding, card_rect.y + padding, card_rect.width - 2 * padding, int(card_rect.height * 0.68))
+
+def baked_cover_specs(screen_width):
+    hero_width, hero_height = hero_card_size(screen_width)
+    focus_rect = focus_image_rect(pygame.Rect(0, 0, hero_width, hero_height))
+    specs = {(focus_rect.width, focus_rect.height, 14)}
+    
+    for distance in (1, 2, 3):
+        scale = card_scale(distance)
+        side_rect = side_image_rect(pygame.Rect(0, 0, int(hero_width * scale), int(hero_height * scale)))
+        specs.add((side_rect.width, side_rect.height, 16))
+        
+    return sorted(specs)
+
+@lru_cache(maxsize=None)
 def get_font(size): 
     return pygame.font.Font(None, size)
 
@@ -74,9 +129,9 @@ class JoyInput:
             axes = self.joystick.get_numaxes()
             buttons = self.joystick.get_numbuttons()
             hats = self.joystick.get_numhats()
-            print(f"[LAUNCHER] Using joystick: {name} | axes:{axes} buttons:{buttons} hats:{hats}")
+            telemetry.emit("joystick", name=name, axes=axes, buttons=buttons, hats=hats)
         else:
-            print("[LAUNCHER] No joystick detected.")
+            telemetry.emit("joystick", name=None)
             
         self.previous_buttons = {}
         self.previous_hat = (0, 0)
@@ -98,7 +153,7 @@ class JoyInput:
                 
                 if is_pressed != was_pressed:
                     state = 'DOWN' if is_pressed else 'UP'
-                    print(f"[LAUNCHER] BUTTON {button_index} {state}")
+                    telemetry.emit("button", index=button_index, state=state)
                 self.previous_buttons[button_index] = is_pressed
 
             current_hat = (0, 0)
@@ -106,13 +161,13 @@ class JoyInput:
                 current_hat = self.joystick.get_hat(0)
                 
             if current_hat != self.previous_hat:
-                print(f"[LAUNCHER] HAT0 -> {current_hat}")
+                telemetry.emit("hat", index=0, value=current_hat)
             self.previous_hat = current_hat
 
             axis_x = self.joystick.get_axis(0) if self.joystick.get_numaxes() > 0 else 0.0
             
             if abs(axis_x - self.previous_axis_x) >= 0.1 or axis_x in (-1.0, 0.0, 1.0):
-                print(f"[LAUNCHER] AXIS0 {axis_x:+.2f}")
+                telemetry.emit("axis", index=0, value=round(axis_x, 2))
             self.previous_axis_x = axis_x
 
             direction_x = current_hat[0]
@@ -136,7 +191,7 @@ class JoyInput:
         self.previous_actions[action] = is_pressed_now
         
         if is_pressed_now and not was_pressed:
-            print(f"[LAUNCHER] ACTION {action.name} PRESSED")
+            telemetry.emit("action", name=action.name)
             
         return is_pressed_now and not was_pressed
 
@@ -148,6 +203,9 @@ class GameEntry:
     path: str
     cover: Optional[pygame.Surface]
     accent: Tuple[int, int, int]
+    baked_covers: Dict[Tuple[int, int, int], pygame.Surface] = field(default_factory=dict)
+    preview: Optional[PreviewSource] = None
+    heartbeat: bool = False
 
 
 def load_cover_image(filepath):
@@ -156,6 +214,28 @@ def load_cover_image(filepath):
     except Exception: 
         return None
 
+def load_shared_image(filepath):
+    try:
+        key = asset_cache.file_key("image", filepath)
+    except OSError:
+        return None
+    return asset_cache.get_cache().get_or_load(key, lambda: load_cover_image(filepath))
+
+def load_baked_covers(game_path, cover_filepath):
+    baked_covers = {}
+    manifest = build_assets.load_manifest(game_path)
+    if not manifest:
+        return baked_covers
+        
+    for width, height, radius in baked_cover_specs(SCREEN_WIDTH):
+        source_hash = build_assets.cover_hash(cover_filepath, width, height, radius)
+        artifact_path = build_assets.find_artifact(game_path, build_assets.cover_artifact_name(width, height, radius), source_hash, manifest)
+        baked_cover = load_shared_image(artifact_path) if artifact_path else None
+        if baked_cover:
+            baked_covers[(width, height, radius)] = baked_cover
+            
+    return baked_covers
+
 def discover_games(root_directory):
     discovered_games = []
     
@@ -172,6 +252,7 @@ def discover_games(root_directory):
         title = slug.replace("_", " ").title()
         subtitle = ""
         accent_color = (64, 140, 255)
+        metadata = {}
         meta_filepath = os.path.join(game_path, "meta.json")
         
         if os.path.isfile(meta_filepath):
@@ -187,15 +268,16 @@ def discover_games(root_directory):
                 pass
                 
         cover_image = None
-        valid_cover_filenames = ("cover.png", "cover.jpg", "cover.jpeg", "cover.webp")
+        baked_covers = {}
+        cover_filepath = build_assets.find_cover(game_path)
         
-        for filename in valid_cover_filenames:
-            cover_filepath = os.path.join(game_path, filename)
-            if os.path.isfile(cover_filepath): 
-                cover_image = load_cover_image(cover_filepath)
-                break
+        if cover_filepath: 
+            cover_image = load_shared_image(cover_filepath)
+            baked_covers = load_baked_covers(game_path, cover_filepath)
                 
-        discovered_games.append(GameEntry(slug, title, subtitle, game_path, cover_image, accent_color))
+        preview = find_preview(game_path, metadata) if isinstance(metadata, dict) else None
+        heartbeat = isinstance(metadata, dict) and metadata.get("heartbeat") is True
+        discovered_games.append(GameEntry(slug, title, subtitle, game_path, cover_image, accent_color, baked_covers, preview, heartbeat))
         
     return discovered_games
 
@@ -210,10 +292,10 @@ def paint_background(surface):
     except Exception: 
         surface.blit(band_surface, (0, int(height * 0.06)))
 
-def draw_side_card(surface, entry, rect, fade_amount):
+def draw_side_card(surface, entry, rect, fade_amount, smooth=True):
     draw_rounded_rect(surface, rect, CARD_BACKGROUND_COLOR, 20)
-    inner_rect = rect.inflate(-14, -14)
-    blit_rounded_image(surface, entry.cover, inner_rect, 16)
+    inner_rect = side_image_rect(rect)
+    blit_cover(surface, entry, inner_rect, 16, smooth)
     
     dim_overlay = pygame.Surface(inner_rect.size, pygame.SRCALPHA)
     dim_overlay.fill((0, 0, 0, int(200 * (1 - fade_amount))))
@@ -221,147 +303,223 @@ def draw_side_card(surface, entry, rect, fade_amount):
     
     pygame.draw.rect(surface, (*entry.accent, 50), rect, 2)
 
-def draw_focus_card_base(surface, entry, rect):
+def draw_focus_card_base(surface, entry, rect, preview_frame=None, smooth=True):
     draw_rounded_rect(surface, rect, CARD_BACKGROUND_COLOR, 20)
     padding = 16
     
-    image_rect = pygame.Rect(rect.x + padding, rect.y + padding, rect.width - 2 * padding, int(rect.height * 0.68))
+    image_rect = focus_image_rect(rect, padding)
     footer_rect = pygame.Rect(rect.x + padding, image_rect.bottom + 8, rect.width - 2 * padding, rect.bottom - (image_rect.bottom + 8) - padding)
     
-    blit_rounded_image(surface, entry.cover, image_rect, 14)
+    if preview_frame is not None and preview_frame.get_size() == image_rect.size:
+        surface.blit(preview_frame, image_rect.topleft)
+    else:
+        blit_cover(surface, entry, image_rect, 14, smooth)
     draw_rounded_rect(surface, footer_rect, (22, 23, 28), 12)
     pygame.draw.rect(surface, (*entry.accent, 80), rect, 2)
     
     return footer_rect
 
+def draw_loading_screen(surface, entry, time_elapsed):
+    paint_background(surface)
+    width, height = surface.get_size()
+    
+    spinner_rect = pygame.Rect(0, 0, 72, 72)
+    spinner_rect.center = (width // 2, int(height * 0.48))
+    start_angle = -time_elapsed * 5.0
+    pygame.draw.circle(surface, CARD_BACKGROUND_COLOR, spinner_rect.center, spinner_rect.width // 2, 6)
+    pygame.draw.arc(surface, entry.accent, spinner_rect, start_angle, start_angle + math.pi * 0.6, 6)
+    
+    title_text = get_font(44).render(entry.title, True, TEXT_COLOR_PRIMARY)
+    surface.blit(title_text, title_text.get_rect(center=(width // 2, spinner_rect.bottom + 44)))
+    
+    dots = "." * (int(time_elapsed * 3) % 4)
+    loading_text = get_font(24).render("Loading" + dots, True, TEXT_COLOR_SECONDARY)
+    surface.blit(loading_text, (width // 2 - loading_text.get_width() // 2, spinner_rect.bottom + 74))
+
 def run():
-    screen_width, screen_height = 1180, 600
+    telemetry.start("launcher")
+    profiler.configure("launcher")
+    quality.configure()
+    sound.configure(os.path.join(os.path.dirname(os.path.abspath(__file__)), "sounds"), ("menu_move", "menu_launch"))
+    asset_cache.purge_stale_segments()
+    asset_cache.get_cache().export_environment(os.environ)
+    screen_width, screen_height = SCREEN_WIDTH, SCREEN_HEIGHT
     screen = pygame.display.set_mode((screen_width, screen_height))
     pygame.display.set_caption("Arcade Launcher")
     clock = pygame.time.Clock()
 
     games_directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), "games")
-    games = discover_games(games_directory)
+    with profiler.scope("discovery"):
+        games = discover_games(games_directory)
     total_games = len(games)
     
     joystick_input = JoyInput(joy_index=0, deadzone=0.35)
+    game_supervisor = GameSupervisor()
+    prewarmer = Prewarmer(max_workers=1)
+    
+    preview_size = focus_image_rect(pygame.Rect((0, 0), hero_card_size(screen_width))).size
+    preview_player = PreviewPlayer(lambda image: render_rounded_image(image, preview_size, 14))
+    active_session = None
+    launching_entry = None
 
     current_index = 0
     scroll_position = float(current_index)
     time_elapsed = 0.0
 
     while True:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT: 
-                pygame.quit()
-                sys.exit()
-
-        joystick_input.update()
+        with profiler.scope("input"):
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT: 
+                    prewarmer.shutdown()
+                    game_supervisor.shutdown()
+                    pygame.quit()
+                    sys.exit()
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_F12:
+                    profiler.request_capture()
+
+            joystick_input.update()
+            profiler.poll_combo(joystick_input.joystick)
+
+        if active_session is not None:
+            delta_time = clock.tick(60) / 1000.0
+            
+            session_state = active_session.poll()
+            still_loading = (session_state == SessionState.RUNNING and not launching_entry.heartbeat
+                             and active_session.duration < MIN_LOADING_SECONDS)
+            if session_state == SessionState.STARTING or still_loading:
+                draw_loading_screen(screen, launching_entry, time_elapsed)
+                pygame.display.flip()
+                time_elapsed += delta_time
+                continue
+                
+            pygame.display.quit()
+            active_session.wait()
+            game_supervisor.keep_suspended(active_session)
+            active_session = None
+                
+            pygame.display.init()
+            screen = pygame.display.set_mode((screen_width, screen_height))
+            clock = pygame.time.Clock()
+            
+            with profiler.scope("discovery"):
+                games = discover_games(games_directory)
+            total_games = len(games)
+            current_index = min(current_index, total_games - 1) if total_games > 0 else 0
+            scroll_position = float(current_index)
+            joystick_input = JoyInput(joy_index=0, deadzone=0.35)
+            quality.reset()
+            continue
 
         if total_games > 0:
             if joystick_input.is_action_just_pressed(Action.RIGHT): 
                 current_index = (current_index + 1) % total_games
+                sound.play("menu_move")
             if joystick_input.is_action_just_pressed(Action.LEFT):  
                 current_index = (current_index - 1) % total_games
+                sound.play("menu_move")
 
-        delta_time = clock.tick(60) / 1000.0
+        with profiler.scope("tick"):
+            frame_ms = clock.tick(60)
+            quality.record(frame_ms, clock.get_rawtime())
+            delta_time = frame_ms / 1000.0
+        quality_level = quality.current()
         scroll_position += (current_index - scroll_position) * min(1.0, delta_time * 10.0)
 
-        paint_background(screen)
+        with profiler.scope("cards"):
+            paint_background(screen)
 
-        if total_games > 0:
-            hero_width = int(min(screen_width * 0.50, 760))
-            hero_height = int(hero_width * 0.60)
-            center_rect = pygame.Rect(0, 0, hero_width, hero_height)
-            center_rect.center = (screen_width // 2, int(screen_height * 0.56))
-            card_spacing = int(hero_width * 0.72)
+            if total_games > 0:
+                hero_width, hero_height = hero_card_size(screen_width)
+                center_rect = pygame.Rect(0, 0, hero_width, hero_height)
+                center_rect.center = (screen_width // 2, int(screen_height * 0.56))
+                card_spacing = int(hero_width * 0.72)
             
-            render_items = []
+                render_items = []
             
-            for index in range(total_games):
-                distance_from_center = ((index - scroll_position + total_games / 2) % total_games) - total_games / 2
+                for index in range(total_games):
+                    distance_from_center = ((index - scroll_position + total_games / 2) % total_games) - total_games / 2
                 
-                if abs(distance_from_center) > 3: 
-                    continue
+                    if abs(distance_from_center) > quality_level.side_cards: 
+                        continue
                     
-                scale_factor = 0.62 + 0.38 * max(0.0, 1.0 - abs(distance_from_center) * 0.55)
-                x_offset = int(distance_from_center * card_spacing)
-                y_offset = int(abs(distance_from_center) * hero_height * 0.10)
+                    scale_factor = card_scale(distance_from_center)
+                    x_offset = int(distance_from_center * card_spacing)
+                    y_offset = int(abs(distance_from_center) * hero_height * 0.10)
                 
-                translated_rect = center_rect.move(x_offset, y_offset)
-                final_rect = pygame.Rect(translated_rect.x, translated_rect.y, int(center_rect.width * scale_factor), int(center_rect.height * scale_factor))
+                    translated_rect = center_rect.move(x_offset, y_offset)
+                    final_rect = pygame.Rect(translated_rect.x, translated_rect.y, int(center_rect.width * scale_factor), int(center_rect.height * scale_factor))
                 
-                render_items.append((index, distance_from_center, scale_factor, final_rect))
+                    render_items.append((index, distance_from_center, scale_factor, final_rect))
                 
-            for index, distance, scale, rect in sorted(render_items, key=lambda item: item[2]):
-                if index == current_index: 
-                    continue
-                fade = 0.85 if abs(distance) < 0.5 else 0.65
-                draw_side_card(screen, games[index], rect, fade)
+                for index, distance, scale, rect in sorted(render_items, key=lambda item: item[2]):
+                    if index == current_index: 
+                        continue
+                    fade = 0.85 if abs(distance) < 0.5 else 0.65
+                    draw_side_card(screen, games[index], rect, fade, quality_level.smooth_scaling)
                 
-            focused_footer = None
-            focused_entry = None
-            focused_scale = None
+                focused_footer = None
+                focused_entry = None
+                focused_scale = None
             
-            for index, distance, scale, rect in render_items:
-                if index == current_index:
-                    focused_footer = draw_focus_card_base(screen, games[index], rect)
-                    focused_entry = games[index]
-                    focused_scale = scale
-                    break
-
-        title_text = get_font(66).render("ARCADE", True, TEXT_COLOR_PRIMARY)
-        screen.blit(title_text, (48, 40))
+                for index, distance, scale, rect in render_items:
+                    if index == current_index:
+                        preview_player.focus(games[index])
+                        preview_frame = preview_player.update(delta_time)
+                        focused_footer = draw_focus_card_base(screen, games[index], rect, preview_frame,
+                                                              quality_level.smooth_scaling)
+                        focused_entry = games[index]
+                        focused_scale = scale
+                        break
+                    
+                prewarmer.focus(focused_entry)
+
+        with profiler.scope("text"):
+            title_text = get_font(66).render("ARCADE", True, TEXT_COLOR_PRIMARY)
+            screen.blit(title_text, (48, 40))
         
-        subtitle_text = get_font(22).render("D-pad/Stick: browse  •  A: play  •  B/Start: back", True, TEXT_COLOR_SECONDARY)
-        screen.blit(subtitle_text, (48, 40 + title_text.get_height() + 6))
+            subtitle_text = get_font(22).render("D-pad/Stick: browse  •  A: play  •  B/Start: back", True, TEXT_COLOR_SECONDARY)
+            screen.blit(subtitle_text, (48, 40 + title_text.get_height() + 6))
 
-        if total_games > 0 and focused_entry:
-            game_title_text = get_font(int(38 * focused_scale)).render(focused_entry.title, True, TEXT_COLOR_PRIMARY)
-            screen.blit(game_title_text, (focused_footer.x + 14, focused_footer.y + 10))
+            if total_games > 0 and focused_entry:
+                game_title_text = get_font(int(38 * focused_scale)).render(focused_entry.title, True, TEXT_COLOR_PRIMARY)
+                screen.blit(game_title_text, (focused_footer.x + 14, focused_footer.y + 10))
             
-            if focused_entry.subtitle:
-                game_subtitle_text = get_font(int(22 * focused_scale)).render(focused_entry.subtitle, True, TEXT_COLOR_SECONDARY)
-                screen.blit(game_subtitle_text, (focused_footer.x + 14, focused_footer.bottom - 28))
+                if focused_entry.subtitle:
+                    game_subtitle_text = get_font(int(22 * focused_scale)).render(focused_entry.subtitle, True, TEXT_COLOR_SECONDARY)
+                    screen.blit(game_subtitle_text, (focused_footer.x + 14, focused_footer.bottom - 28))
                 
-            pulse_effect = 0.5 * (1 + math.sin(time_elapsed * 2.2))
-            pill_width = min(focused_footer.width - 20, int(360 * focused_scale))
-            pill_height = int(40 * focused_scale)
+                pulse_effect = 0.5 * (1 + math.sin(time_elapsed * 2.2))
+                pill_width = min(focused_footer.width - 20, int(360 * focused_scale))
+                pill_height = int(40 * focused_scale)
             
-            pill_rect = pygame.Rect(0, 0, pill_width, pill_height)
-            pill_rect.center = (focused_footer.centerx, focused_footer.bottom + int(24 * focused_scale))
+                pill_rect = pygame.Rect(0, 0, pill_width, pill_height)
+                pill_rect.center = (focused_footer.centerx, focused_footer.bottom + int(24 * focused_scale))
             
-            draw_rounded_rect(screen, pill_rect, (*focused_entry.accent, int(190 + 40 * pulse_effect)), 999)
+                draw_rounded_rect(screen, pill_rect, (*focused_entry.accent, int(190 + 40 * pulse_effect)), 999)
             
-            play_text = get_font(int(24 * focused_scale)).render("Press A to Play", True, (255, 255, 255))
-            screen.blit(play_text, play_text.get_rect(center=pill_rect.center))
+                play_text = get_font(int(24 * focused_scale)).render("Press A to Play", True, (255, 255, 255))
+                screen.blit(play_text, play_text.get_rect(center=pill_rect.center))
 
         if total_games > 0 and joystick_input.is_action_just_pressed(Action.LAUNCH):
-            chosen_game = games[current_index]
-            print(f"[LAUNCHER] Launching {chosen_game.slug}")
-            
-            pygame.display.quit()
+            launching_entry = games[current_index]
+            preview_player.stop()
+            sound.play("menu_launch")
             try: 
-                subprocess.call([sys.executable, os.path.join(chosen_game.path, "main.py")])
+                active_session = game_supervisor.launch(launching_entry.slug, os.path.join(launching_entry.path, "main.py"),
+                                                        heartbeat=launching_entry.heartbeat)
             except Exception as error: 
-                print("[LAUNCHER] Game error:", error)
-                
-            pygame.display.init()
-            screen = pygame.display.set_mode((screen_width, screen_height))
-            clock = pygame.time.Clock()
-            
-            games = discover_games(games_directory)
-            total_games = len(games)
-            current_index = min(current_index, total_games - 1) if total_games > 0 else 0
-            scroll_position = float(current_index)
-            joystick_input = JoyInput(joy_index=0, deadzone=0.35)
+                telemetry.emit("game_error", slug=launching_entry.slug, error=str(error))
 
         if joystick_input.is_action_just_pressed(Action.BACK):
-            print("[LAUNCHER] Back/Exit pressed")
+            telemetry.emit("exit")
+            prewarmer.shutdown()
+            game_supervisor.shutdown()
             pygame.quit()
             sys.exit()
 
-        pygame.display.flip()
+        with profiler.scope("flip"):
+            pygame.display.flip()
+        profiler.frame_end()
         time_elapsed += delta_time
 
 if __name__ == "__main__":
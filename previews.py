@@ -0,0 +1,138 @@
+import os
+import glob
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import pygame
+
+PREVIEW_DIRECTORY = "preview"
+PREVIEW_STRIP = "preview.png"
+PREVIEW_EXTENSIONS = (".png", ".jpg", ".jpeg", ".webp")
+DEFAULT_FPS = 12
+DEFAULT_CAPACITY = 6
+
+
+@dataclass
+class PreviewSource:
+    frame_paths: Tuple[str, ...] = ()
+    strip_path: Optional[str] = None
+    strip_frames: int = 0
+    fps: float = DEFAULT_FPS
+
+    @property
+    def frame_count(self):
+        return len(self.frame_paths) if self.frame_paths else self.strip_frames
+
+
+def find_preview(game_path, metadata):
+    preview_metadata = metadata.get("preview") if isinstance(metadata.get("preview"), dict) else {}
+    try:
+        fps = float(preview_metadata.get("fps", DEFAULT_FPS))
+    except (TypeError, ValueError):
+        fps = DEFAULT_FPS
+    fps = fps if fps > 0 else DEFAULT_FPS
+
+    frame_paths = tuple(sorted(
+        path for path in glob.glob(os.path.join(game_path, PREVIEW_DIRECTORY, "*"))
+        if path.lower().endswith(PREVIEW_EXTENSIONS)))
+    if len(frame_paths) > 1:
+        return PreviewSource(frame_paths=frame_paths, fps=fps)
+
+    strip_path = os.path.join(game_path, PREVIEW_STRIP)
+    strip_frames = preview_metadata.get("frames")
+    if os.path.isfile(strip_path) and isinstance(strip_frames, int) and strip_frames > 1:
+        return PreviewSource(strip_path=strip_path, strip_frames=strip_frames, fps=fps)
+    return None
+
+
+class PreviewStream:
+    # Decodes frames on a worker thread into a ring of at most `capacity` prepared
+    # surfaces; the worker blocks while the ring is full, so memory stays bounded.
+    def __init__(self, source, prepare, capacity=DEFAULT_CAPACITY):
+        self.source = source
+        self.prepare = prepare
+        self.frames = deque()
+        self.capacity = capacity
+        self.condition = threading.Condition()
+        self.stopped = False
+        self.failed = False
+        self.thread = threading.Thread(target=self._decode, name="preview-decoder", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        with self.condition:
+            self.stopped = True
+            self.frames.clear()
+            self.condition.notify_all()
+
+    def take(self):
+        with self.condition:
+            if not self.frames:
+                return None
+            frame = self.frames.popleft()
+            self.condition.notify_all()
+            return frame
+
+    def _load_frame(self, index, strip):
+        if strip is not None:
+            frame_width = strip.get_width() // self.source.strip_frames
+            return strip.subsurface((index * frame_width, 0, frame_width, strip.get_height()))
+        return pygame.image.load(self.source.frame_paths[index])
+
+    def _decode(self):
+        strip = None
+        index = 0
+        try:
+            if self.source.strip_path:
+                strip = pygame.image.load(self.source.strip_path)
+            while True:
+                frame = self.prepare(self._load_frame(index, strip))
+                index = (index + 1) % self.source.frame_count
+                with self.condition:
+                    while len(self.frames) >= self.capacity and not self.stopped:
+                        self.condition.wait()
+                    if self.stopped:
+                        return
+                    self.frames.append(frame)
+        except (pygame.error, OSError, ValueError):
+            self.failed = True
+
+
+class PreviewPlayer:
+    def __init__(self, prepare, capacity=DEFAULT_CAPACITY):
+        self.prepare = prepare
+        self.capacity = capacity
+        self.slug = None
+        self.stream = None
+        self.frame = None
+        self.frame_clock = 0.0
+
+    def focus(self, entry):
+        slug = entry.slug if entry is not None and entry.preview is not None else None
+        if slug == self.slug:
+            return
+        self.stop()
+        self.slug = slug
+        if slug is not None:
+            self.stream = PreviewStream(entry.preview, self.prepare, self.capacity)
+
+    def stop(self):
+        if self.stream is not None:
+            self.stream.stop()
+        self.stream = None
+        self.slug = None
+        self.frame = None
+        self.frame_clock = 0.0
+
+    def update(self, delta_time):
+        if self.stream is None or self.stream.failed:
+            return None
+        self.frame_clock -= delta_time
+        if self.frame is None or self.frame_clock <= 0:
+            next_frame = self.stream.take()
+            if next_frame is not None:
+                self.frame = next_frame
+                self.frame_clock = max(0.0, self.frame_clock) + 1.0 / self.stream.source.fps
+        return self.frame
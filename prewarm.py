@@ -0,0 +1,161 @@
+import os
+import ast
+import json
+import time
+import compileall
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+
+import telemetry
+
+ROOT_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+READ_CHUNK_SIZE = 1 << 20
+
+
+def validate_meta(meta_filepath):
+    if not os.path.isfile(meta_filepath):
+        return []
+    try:
+        with open(meta_filepath, "r", encoding="utf-8") as meta_file:
+            metadata = json.load(meta_file)
+    except (OSError, ValueError) as error:
+        return [f"unreadable: {error}"]
+
+    if not isinstance(metadata, dict):
+        return ["top level is not an object"]
+
+    problems = []
+    for key in ("title", "subtitle"):
+        if key in metadata and not isinstance(metadata[key], str):
+            problems.append(f"{key} is not a string")
+
+    accent = metadata.get("accent")
+    if accent is not None:
+        if not (isinstance(accent, list) and len(accent) == 3
+                and all(isinstance(value, int) and 0 <= value <= 255 for value in accent)):
+            problems.append("accent is not three 0-255 integers")
+
+    if "heartbeat" in metadata and not isinstance(metadata["heartbeat"], bool):
+        problems.append("heartbeat is not a boolean")
+
+    preview = metadata.get("preview")
+    if preview is not None and not isinstance(preview, dict):
+        problems.append("preview is not an object")
+    return problems
+
+
+def find_local_imports(script_path, search_paths):
+    try:
+        with open(script_path, "r", encoding="utf-8") as script_file:
+            tree = ast.parse(script_file.read(), script_path)
+    except (OSError, SyntaxError, ValueError):
+        return []
+
+    module_names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            module_names.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            module_names.add(node.module.split(".")[0])
+
+    sources = []
+    for name in sorted(module_names):
+        for directory in search_paths:
+            candidate = os.path.join(directory, name + ".py")
+            if os.path.isfile(candidate):
+                sources.append(candidate)
+                break
+        else:
+            try:
+                spec = importlib.util.find_spec(name)
+            except (ImportError, ValueError):
+                spec = None
+            if spec and spec.origin and spec.origin.endswith(".py"):
+                sources.append(spec.origin)
+    return sources
+
+
+def warm_page_cache(filepath):
+    size = os.path.getsize(filepath)
+    if hasattr(os, "posix_fadvise"):
+        descriptor = os.open(filepath, os.O_RDONLY)
+        try:
+            os.posix_fadvise(descriptor, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(descriptor)
+        return size
+
+    with open(filepath, "rb") as asset_file:
+        while asset_file.read(READ_CHUNK_SIZE):
+            pass
+    return size
+
+
+class Prewarmer:
+    # Work starts only once a card has held focus for dwell_time, and at most
+    # max_workers games are warmed at a time so scrolling never builds a queue.
+    def __init__(self, max_workers=1, dwell_time=0.35, yield_interval=0.002):
+        self.max_workers = max_workers
+        self.dwell_time = dwell_time
+        self.yield_interval = yield_interval
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="prewarm")
+        self.focused_slug = None
+        self.focused_since = 0.0
+        self.pending = set()
+        self.warmed = set()
+
+    def focus(self, entry):
+        now = time.monotonic()
+        if entry is None:
+            self.focused_slug = None
+            return
+        if entry.slug != self.focused_slug:
+            self.focused_slug = entry.slug
+            self.focused_since = now
+            return
+
+        if entry.slug in self.warmed or entry.slug in self.pending:
+            return
+        if now - self.focused_since < self.dwell_time or len(self.pending) >= self.max_workers:
+            return
+
+        self.pending.add(entry.slug)
+        self.executor.submit(self._prewarm, entry.slug, entry.path)
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _prewarm(self, slug, game_path):
+        started_at = time.monotonic()
+        compiled = 0
+        warmed_bytes = 0
+        errors = []
+
+        try:
+            problems = validate_meta(os.path.join(game_path, "meta.json"))
+            if problems:
+                telemetry.emit("meta_invalid", slug=slug, problems=problems)
+
+            script_path = os.path.join(game_path, "main.py")
+            sources = [script_path] + find_local_imports(script_path, (game_path, ROOT_DIRECTORY))
+            for source_path in sources:
+                if compileall.compile_file(source_path, quiet=2):
+                    compiled += 1
+                else:
+                    errors.append(os.path.relpath(source_path, ROOT_DIRECTORY))
+                time.sleep(self.yield_interval)
+
+            for directory, subdirectories, filenames in os.walk(game_path):
+                subdirectories[:] = [name for name in subdirectories if name != "__pycache__"]
+                for filename in filenames:
+                    try:
+                        warmed_bytes += warm_page_cache(os.path.join(directory, filename))
+                    except OSError:
+                        errors.append(filename)
+                    time.sleep(self.yield_interval)
+
+            telemetry.emit("prewarm", slug=slug, compiled=compiled, bytes=warmed_bytes,
+                           errors=errors, duration=round(time.monotonic() - started_at, 3))
+            self.warmed.add(slug)
+        finally:
+            self.pending.discard(slug)
@@ -0,0 +1,204 @@
+import os
+import time
+import pstats
+import cProfile
+import threading
+from collections import defaultdict
+
+import telemetry
+
+DEFAULT_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs", "profiles")
+FRAMES_ENV = "ARCADE_PROFILE_FRAMES"
+COMBO_BUTTONS = (4, 5)
+DEFAULT_CAPTURE_FRAMES = 120
+MAX_STACK_DEPTH = 48
+MIN_STACK_WEIGHT = 1e-6
+
+
+class _NullScope:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        return False
+
+
+_NULL_SCOPE = _NullScope()
+
+
+class _Scope:
+    __slots__ = ("profiler", "name")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.profiler.stack.append([self.name, time.perf_counter(), 0.0])
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.profiler._close_scope()
+        return False
+
+
+def _function_label(function):
+    filename, line, name = function
+    if filename == "~":
+        return name
+    return f"{name} ({os.path.basename(filename)}:{line})"
+
+
+def collapse_profile(stats):
+    # cProfile only keeps caller->callee edges, so each function's own time is
+    # pushed up through its callers in proportion to the time spent on each edge.
+    entries = stats.stats
+    collapsed = defaultdict(float)
+
+    def walk(function, weight, labels, visited):
+        callers = entries.get(function, (0, 0, 0.0, 0.0, {}))[4]
+        total = sum(edge[3] for edge in callers.values())
+        if not callers or total <= 0 or len(labels) >= MAX_STACK_DEPTH or weight < MIN_STACK_WEIGHT:
+            collapsed[";".join(reversed(labels))] += weight
+            return
+        for caller, edge in callers.items():
+            if caller in visited:
+                collapsed[";".join(reversed(labels))] += weight * edge[3] / total
+                continue
+            walk(caller, weight * edge[3] / total, labels + [_function_label(caller)], visited | {caller})
+
+    for function, (_, _, own_time, _, _) in entries.items():
+        if own_time > 0:
+            walk(function, own_time, [_function_label(function)], frozenset((function,)))
+    return collapsed
+
+
+def write_collapsed(filepath, collapsed):
+    with open(filepath, "w", encoding="utf-8") as collapsed_file:
+        for stack, seconds in sorted(collapsed.items()):
+            microseconds = int(round(seconds * 1_000_000))
+            if microseconds > 0:
+                collapsed_file.write(f"{stack} {microseconds}\n")
+
+
+class Profiler:
+    def __init__(self, source, directory=None):
+        self.source = source
+        self.directory = directory or DEFAULT_DIRECTORY
+        self.capturing = False
+        self.requested_frames = 0
+        self.frames_left = 0
+        self.captured_frames = 0
+        self.frame_started = 0.0
+        self.frame_total = 0.0
+        self.stack = []
+        self.scope_times = defaultdict(float)
+        self.profile = None
+        self.combo_was_held = False
+
+    def scope(self, name):
+        if not self.capturing:
+            return _NULL_SCOPE
+        return _Scope(self, name)
+
+    def _close_scope(self):
+        name, started, child_time = self.stack.pop()
+        elapsed = time.perf_counter() - started
+        path = ";".join(["frame"] + [entry[0] for entry in self.stack] + [name])
+        self.scope_times[path] += elapsed - child_time
+        if self.stack:
+            self.stack[-1][2] += elapsed
+
+    def request_capture(self, frames=DEFAULT_CAPTURE_FRAMES):
+        if not self.capturing and frames > 0:
+            self.requested_frames = frames
+
+    def poll_combo(self, joystick, frames=DEFAULT_CAPTURE_FRAMES):
+        held = bool(joystick) and joystick.get_numbuttons() > max(COMBO_BUTTONS) and all(
+            joystick.get_button(button) for button in COMBO_BUTTONS)
+        if held and not self.combo_was_held:
+            self.request_capture(frames)
+        self.combo_was_held = held
+
+    def frame_end(self):
+        now = time.perf_counter()
+        if self.capturing:
+            self.frame_total += now - self.frame_started
+            self.frames_left -= 1
+            if self.frames_left <= 0:
+                self._finish_capture()
+        elif self.requested_frames:
+            self._start_capture()
+        self.frame_started = time.perf_counter()
+
+    def _start_capture(self):
+        self.frames_left = self.requested_frames
+        self.captured_frames = self.requested_frames
+        self.requested_frames = 0
+        self.scope_times = defaultdict(float)
+        self.frame_total = 0.0
+        self.stack = []
+        self.capturing = True
+        self.profile = cProfile.Profile()
+        self.profile.enable()
+        telemetry.emit("profile_start", frames=self.frames_left)
+
+    def _finish_capture(self):
+        self.profile.disable()
+        self.capturing = False
+        scope_times = dict(self.scope_times)
+        scope_times["frame"] = self.frame_total - sum(scope_times.values())
+        args = (self.profile, scope_times, self.captured_frames, self.frame_total)
+        self.profile = None
+        threading.Thread(target=self._write_capture, args=args, name="profiler-writer", daemon=True).start()
+
+    def _write_capture(self, profile, scope_times, frames, frame_total):
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        basepath = os.path.join(self.directory, f"{self.source}-{stamp}")
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            stats = pstats.Stats(profile)
+            stats.dump_stats(basepath + ".prof")
+            write_collapsed(basepath + "-cprofile.folded", collapse_profile(stats))
+            write_collapsed(basepath + "-scopes.folded", scope_times)
+        except OSError as error:
+            telemetry.emit("profile_error", error=str(error))
+            return
+
+        telemetry.emit("profile_saved", path=basepath, frames=frames,
+                       mean_frame_ms=round(frame_total * 1000 / max(1, frames), 3))
+
+
+_instance = None
+
+
+def configure(source, directory=None):
+    global _instance
+    _instance = Profiler(source, directory)
+    frames = os.environ.get(FRAMES_ENV)
+    if frames and frames.isdigit():
+        _instance.request_capture(int(frames))
+    return _instance
+
+
+def scope(name):
+    if _instance is None or not _instance.capturing:
+        return _NULL_SCOPE
+    return _Scope(_instance, name)
+
+
+def request_capture(frames=DEFAULT_CAPTURE_FRAMES):
+    if _instance is not None:
+        _instance.request_capture(frames)
+
+
+def poll_combo(joystick):
+    if _instance is not None:
+        _instance.poll_combo(joystick)
+
+
+def frame_end():
+    if _instance is not None:
+        _instance.frame_end()
@@ -0,0 +1,134 @@
+import os
+from collections import deque
+from dataclasses import dataclass
+
+import telemetry
+
+QUALITY_ENV = "ARCADE_QUALITY"
+FRAME_BUDGET_MS = 1000.0 / 60
+MAX_RECOVER_SECONDS = 60.0
+
+
+@dataclass(frozen=True)
+class QualityLevel:
+    name: str
+    particle_scale: float
+    smooth_scaling: bool
+    side_cards: int
+    screen_shake: bool
+
+
+LEVELS = (
+    QualityLevel("high", 1.0, True, 3, True),
+    QualityLevel("medium", 0.6, True, 2, True),
+    QualityLevel("low", 0.35, False, 1, False),
+)
+
+
+class QualityGovernor:
+    # Steps down as soon as a sustained share of frames overrun the budget, but only
+    # steps back up after a long stretch of headroom; an upgrade that overruns again
+    # right away doubles the wait before the next attempt, so it cannot flap.
+    def __init__(self, budget_ms=FRAME_BUDGET_MS, window=45, overrun_ratio=1.25, overrun_share=0.3,
+                 headroom_ratio=0.6, recover_seconds=3.0, cooldown_seconds=1.0, index=0, adaptive=True):
+        self.budget_ms = budget_ms
+        self.overrun_ms = budget_ms * overrun_ratio
+        self.overrun_share = overrun_share
+        self.headroom_ms = budget_ms * headroom_ratio
+        self.cooldown_seconds = cooldown_seconds
+        self.recover_seconds = [recover_seconds] * len(LEVELS)
+        self.adaptive = adaptive
+        self.index = index
+        self.frame_times = deque(maxlen=window)
+        self.work_times = deque(maxlen=window)
+        self.clock = 0.0
+        self.calm_time = 0.0
+        self.cooldown = cooldown_seconds
+        self.upgraded_at = None
+
+    @property
+    def level(self):
+        return LEVELS[self.index]
+
+    def particles(self, count):
+        return max(1, round(count * LEVELS[self.index].particle_scale)) if count > 0 else 0
+
+    def reset(self):
+        self.frame_times.clear()
+        self.work_times.clear()
+        self.calm_time = 0.0
+        self.cooldown = self.cooldown_seconds
+
+    def record(self, frame_ms, work_ms=None):
+        seconds = frame_ms / 1000.0
+        self.clock += seconds
+        if not self.adaptive:
+            return False
+        if self.cooldown > 0:
+            self.cooldown -= seconds
+            return False
+
+        self.frame_times.append(frame_ms)
+        self.work_times.append(frame_ms if work_ms is None else work_ms)
+        if len(self.frame_times) < self.frame_times.maxlen:
+            return False
+
+        overruns = sum(1 for frame_time in self.frame_times if frame_time > self.overrun_ms)
+        if overruns >= self.overrun_share * len(self.frame_times):
+            return self._step(1, "overrun")
+
+        if sum(self.work_times) / len(self.work_times) < self.headroom_ms:
+            self.calm_time += seconds
+        else:
+            self.calm_time = 0.0
+        if self.index > 0 and self.calm_time >= self.recover_seconds[self.index]:
+            return self._step(-1, "headroom")
+        return False
+
+    def _step(self, direction, reason):
+        index = max(0, min(len(LEVELS) - 1, self.index + direction))
+        self.calm_time = 0.0
+        if index == self.index:
+            return False
+
+        if direction > 0 and self.upgraded_at is not None and self.clock - self.upgraded_at < self.recover_seconds[index]:
+            self.recover_seconds[index] = min(MAX_RECOVER_SECONDS, self.recover_seconds[index] * 2)
+        self.upgraded_at = self.clock if direction < 0 else None
+
+        mean_frame_ms = sum(self.frame_times) / len(self.frame_times)
+        mean_work_ms = sum(self.work_times) / len(self.work_times)
+        self.index = index
+        self.reset()
+        telemetry.emit("quality", level=LEVELS[index].name, reason=reason,
+                       mean_frame_ms=round(mean_frame_ms, 2), mean_work_ms=round(mean_work_ms, 2))
+        return True
+
+
+_instance = None
+
+
+def configure(**options):
+    global _instance
+    pinned = os.environ.get(QUALITY_ENV, "").strip().lower()
+    names = [level.name for level in LEVELS]
+    if pinned in names:
+        options.update(index=names.index(pinned), adaptive=False)
+    _instance = QualityGovernor(**options)
+    return _instance
+
+
+def current():
+    return _instance.level if _instance is not None else LEVELS[0]
+
+
+def particles(count):
+    return _instance.particles(count) if _instance is not None else count
+
+
+def record(frame_ms, work_ms=None):
+    return _instance.record(frame_ms, work_ms) if _instance is not None else False
+
+
+def reset():
+    if _instance is not None:
+        _instance.reset()
@@ -0,0 +1,148 @@
+import os
+import math
+import array
+import random
+
+import pygame
+
+import telemetry
+
+BUFFER_ENV = "ARCADE_AUDIO_BUFFER"
+CHANNELS_ENV = "ARCADE_AUDIO_CHANNELS"
+FREQUENCY = 44100
+DEFAULT_BUFFER = 256
+DEFAULT_CHANNELS = 8
+SOUND_EXTENSIONS = (".wav", ".ogg")
+
+# name: (priority, volume, segments); each segment is (waveform, start_hz, end_hz, seconds)
+EFFECTS = {
+    "jump": (1, 0.35, (("square", 320, 640, 0.11),)),
+    "coin": (2, 0.35, (("square", 988, 988, 0.06), ("square", 1319, 1319, 0.14))),
+    "death": (3, 0.5, (("noise", 0, 0, 0.08), ("saw", 420, 70, 0.3))),
+    "level_clear": (3, 0.4, (("square", 523, 523, 0.09), ("square", 659, 659, 0.09), ("square", 784, 784, 0.22))),
+    "menu_move": (1, 0.3, (("sine", 660, 700, 0.045),)),
+    "menu_launch": (2, 0.4, (("sine", 440, 880, 0.16),)),
+}
+
+
+def _env_int(name, default):
+    try:
+        value = int(os.environ.get(name, "") or default)
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
+def pre_init():
+    # Must run before pygame.init(); the default buffer adds tens of milliseconds
+    # between a play() call and the sound reaching the speakers.
+    pygame.mixer.pre_init(frequency=FREQUENCY, size=-16, channels=2, buffer=_env_int(BUFFER_ENV, DEFAULT_BUFFER))
+
+
+def _oscillator(waveform, phase, rng):
+    if waveform == "square":
+        return 1.0 if phase % 1.0 < 0.5 else -1.0
+    if waveform == "saw":
+        return 2.0 * (phase % 1.0) - 1.0
+    if waveform == "noise":
+        return rng.uniform(-1.0, 1.0)
+    return math.sin(phase * math.tau)
+
+
+def synthesize(segments, volume, frequency, channels):
+    samples = array.array("h")
+    rng = random.Random(0)
+    phase = 0.0
+    for waveform, start_hz, end_hz, seconds in segments:
+        count = max(1, int(seconds * frequency))
+        attack = min(count // 4, int(0.004 * frequency)) or 1
+        for index in range(count):
+            progress = index / count
+            phase += (start_hz + (end_hz - start_hz) * progress) / frequency
+            envelope = min(1.0, index / attack) * (1.0 - progress)
+            value = int(_oscillator(waveform, phase, rng) * envelope * volume * 32767)
+            samples.extend((value,) * channels)
+    return pygame.mixer.Sound(buffer=samples.tobytes())
+
+
+class SoundBank:
+    # Every effect is decoded or synthesized up front and played on a fixed set of
+    # reserved channels, so play() never touches the disk or the decoder. When all
+    # channels are busy the oldest sound of the lowest priority is cut, and a new
+    # sound is dropped if everything playing outranks it.
+    def __init__(self, directory=None, names=None, channel_count=None):
+        self.sounds = {}
+        self.priorities = {}
+        self.channels = []
+        self.started = []
+        self.sequence = 0
+
+        mixer_settings = pygame.mixer.get_init()
+        if not mixer_settings:
+            telemetry.emit("audio_unavailable")
+            return
+        frequency, sample_format, output_channels = mixer_settings
+
+        channel_count = channel_count or _env_int(CHANNELS_ENV, DEFAULT_CHANNELS)
+        pygame.mixer.set_num_channels(max(channel_count, pygame.mixer.get_num_channels()))
+        pygame.mixer.set_reserved(channel_count)
+        self.channels = [pygame.mixer.Channel(index) for index in range(channel_count)]
+        self.started = [(0, 0)] * channel_count
+
+        for name in names or EFFECTS:
+            priority, volume, segments = EFFECTS[name]
+            sound = self._load_file(directory, name)
+            if sound is None and sample_format == -16:
+                sound = synthesize(segments, volume, frequency, output_channels)
+            if sound is not None:
+                self.sounds[name] = sound
+                self.priorities[name] = priority
+
+        telemetry.emit("audio", frequency=frequency, channels=channel_count, sounds=sorted(self.sounds))
+
+    def _load_file(self, directory, name):
+        if not directory:
+            return None
+        for extension in SOUND_EXTENSIONS:
+            filepath = os.path.join(directory, name + extension)
+            if os.path.isfile(filepath):
+                try:
+                    return pygame.mixer.Sound(filepath)
+                except pygame.error as error:
+                    telemetry.emit("sound_error", name=name, error=str(error))
+        return None
+
+    def play(self, name):
+        sound = self.sounds.get(name)
+        if sound is None:
+            return None
+        priority = self.priorities[name]
+
+        chosen = None
+        for index, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                chosen = index
+                break
+        if chosen is None:
+            chosen = min(range(len(self.channels)), key=lambda index: self.started[index])
+            if self.started[chosen][0] > priority:
+                return None
+
+        self.sequence += 1
+        self.started[chosen] = (priority, self.sequence)
+        self.channels[chosen].play(sound)
+        return self.channels[chosen]
+
+
+_bank = None
+
+
+def configure(directory=None, names=None):
+    global _bank
+    _bank = SoundBank(directory, names)
+    return _bank
+
+
+def play(name):
+    if _bank is not None:
+        _bank.play(name)
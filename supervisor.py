@@ -0,0 +1,410 @@
+import os
+import sys
+import time
+import atexit
+import signal
+import subprocess
+from dataclasses import dataclass
+from enum import Enum, auto
+from typing import Optional
+
+import telemetry
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+HEARTBEAT_FD_ENV = "ARCADE_HEARTBEAT_FD"
+HEARTBEAT_SUPPORTED = os.name == "posix"
+SUSPEND_ENV = "ARCADE_SUSPEND"
+SUSPEND_MESSAGE = b"S"
+SUSPEND_SUPPORTED = HEARTBEAT_SUPPORTED and hasattr(signal, "SIGSTOP")
+
+
+class SessionState(Enum):
+    STARTING = auto()
+    RUNNING = auto()
+    SUSPENDED = auto()
+    EXITED = auto()
+    KILLED = auto()
+
+
+def _env_number(name, default, cast=int):
+    value = os.environ.get(name)
+    if not value:
+        return default
+    try:
+        number = cast(value)
+    except ValueError:
+        return default
+    return number if number > 0 else None
+
+
+def _env_int(name, default):
+    value = os.environ.get(name)
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+
+@dataclass
+class SupervisorConfig:
+    memory_limit_mb: Optional[int] = 1024
+    address_space_limit_mb: Optional[int] = None
+    cpu_time_limit: Optional[int] = None
+    niceness: int = 0
+    startup_timeout: float = 20.0
+    heartbeat_timeout: float = 5.0
+    poll_interval: float = 0.05
+    suspend_max_games: int = 1
+    suspend_memory_mb: Optional[int] = 512
+
+    @classmethod
+    def from_environment(cls):
+        return cls(
+            memory_limit_mb=_env_number("ARCADE_GAME_MEMORY_MB", 1024),
+            address_space_limit_mb=_env_number("ARCADE_GAME_ADDRESS_SPACE_MB", None),
+            cpu_time_limit=_env_number("ARCADE_GAME_CPU_SECONDS", None),
+            niceness=_env_int("ARCADE_GAME_NICENESS", 0),
+            startup_timeout=_env_number("ARCADE_GAME_STARTUP_TIMEOUT", 20.0, float) or 20.0,
+            heartbeat_timeout=_env_number("ARCADE_GAME_HEARTBEAT_TIMEOUT", 5.0, float) or 5.0,
+            suspend_max_games=max(0, _env_int("ARCADE_SUSPEND_MAX_GAMES", 1)),
+            suspend_memory_mb=_env_number("ARCADE_SUSPEND_MEMORY_MB", 512),
+        )
+
+
+def read_rss_bytes(pid):
+    try:
+        with open(f"/proc/{pid}/statm", "r") as statm_file:
+            resident_pages = int(statm_file.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+
+class GameSession:
+    def __init__(self, slug, process, heartbeat_fd, config):
+        self.slug = slug
+        self.process = process
+        self.heartbeat_fd = heartbeat_fd
+        self.config = config
+        self.state = SessionState.STARTING if heartbeat_fd is not None else SessionState.RUNNING
+        self.started_at = time.monotonic()
+        self.last_heartbeat = None
+        self.last_memory_check = 0.0
+        self.peak_rss = 0
+        self.return_code = None
+        self.kill_reason = None
+        self.suspended_at = None
+        self.resumed_at = None
+
+    @property
+    def finished(self):
+        return self.state in (SessionState.EXITED, SessionState.KILLED)
+
+    @property
+    def duration(self):
+        return round(time.monotonic() - self.started_at, 3)
+
+    def _read_heartbeats(self):
+        if self.heartbeat_fd is None:
+            return
+        try:
+            data = os.read(self.heartbeat_fd, 4096)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""
+
+        if data:
+            self.last_heartbeat = time.monotonic()
+            if self.state == SessionState.STARTING:
+                self.state = SessionState.RUNNING
+                telemetry.emit("game_ready", slug=self.slug, startup=self.duration)
+            if self.resumed_at is not None:
+                telemetry.emit("game_resumed", slug=self.slug,
+                               latency=round(self.last_heartbeat - self.resumed_at, 3))
+                self.resumed_at = None
+            if SUSPEND_MESSAGE in data:
+                self._suspend()
+        else:
+            self._close_heartbeat()
+
+    def _close_heartbeat(self):
+        if self.heartbeat_fd is not None:
+            os.close(self.heartbeat_fd)
+            self.heartbeat_fd = None
+
+    def _check_memory(self, now):
+        if not self.config.memory_limit_mb or now - self.last_memory_check < 0.5:
+            return
+        self.last_memory_check = now
+
+        rss = read_rss_bytes(self.process.pid)
+        if rss is None:
+            return
+        self.peak_rss = max(self.peak_rss, rss)
+        if rss > self.config.memory_limit_mb * 1024 * 1024:
+            self.kill(f"memory limit exceeded ({rss // (1024 * 1024)} MB)")
+
+    def _check_heartbeat(self, now):
+        if self.heartbeat_fd is None and self.last_heartbeat is None:
+            return
+        if self.state == SessionState.STARTING:
+            if now - self.started_at > self.config.startup_timeout:
+                self.kill("no heartbeat during startup")
+        elif self.last_heartbeat is not None and now - self.last_heartbeat > self.config.heartbeat_timeout:
+            self.kill("heartbeat lost")
+
+    def _suspend(self):
+        # The game hides its window and idles before asking; SIGSTOP then takes every
+        # thread in it off the CPU until resume() continues it.
+        try:
+            os.kill(self.process.pid, signal.SIGSTOP)
+        except OSError:
+            return
+        self.state = SessionState.SUSPENDED
+        self.suspended_at = time.monotonic()
+        self.peak_rss = max(self.peak_rss, read_rss_bytes(self.process.pid) or 0)
+        telemetry.emit("game_suspended", slug=self.slug, rss=read_rss_bytes(self.process.pid))
+
+    def resume(self):
+        if self.state != SessionState.SUSPENDED:
+            return False
+        try:
+            os.kill(self.process.pid, signal.SIGCONT)
+        except OSError:
+            return False
+        self.state = SessionState.RUNNING
+        self.resumed_at = self.last_heartbeat = time.monotonic()
+        self.suspended_at = None
+        return True
+
+    def poll(self):
+        if self.finished:
+            return self.state
+
+        self._read_heartbeats()
+
+        return_code = self.process.poll()
+        if return_code is not None:
+            self._finish(return_code)
+            return self.state
+        if self.state == SessionState.SUSPENDED:
+            return self.state
+
+        now = time.monotonic()
+        self._check_heartbeat(now)
+        if not self.finished:
+            self._check_memory(now)
+        return self.state
+
+    def wait(self):
+        while not self.finished and self.state != SessionState.SUSPENDED:
+            self.poll()
+            time.sleep(self.config.poll_interval)
+        return self.state
+
+    def kill(self, reason):
+        if self.finished:
+            return
+        self.kill_reason = reason
+        try:
+            self.process.kill()
+        except OSError:
+            pass
+        self.return_code = self.process.wait()
+        self._close_heartbeat()
+        self.state = SessionState.KILLED
+        telemetry.emit("game_killed", slug=self.slug, reason=reason, duration=self.duration)
+
+    def _finish(self, return_code):
+        self.return_code = return_code
+        self._close_heartbeat()
+        self.state = SessionState.EXITED
+        telemetry.emit("game_exit", slug=self.slug, return_code=return_code,
+                       duration=self.duration, peak_rss=self.peak_rss)
+        if return_code != 0:
+            telemetry.emit("game_crash", slug=self.slug, return_code=return_code)
+
+
+class GameSupervisor:
+    def __init__(self, config=None):
+        self.config = config or SupervisorConfig.from_environment()
+        self.suspended = {}
+        atexit.register(self.shutdown)
+
+    @property
+    def suspend_enabled(self):
+        return SUSPEND_SUPPORTED and self.config.suspend_max_games > 0
+
+    def keep_suspended(self, session):
+        if session.state != SessionState.SUSPENDED:
+            return
+        if not self.suspend_enabled:
+            session.kill("suspend disabled")
+            return
+        self.suspended.pop(session.slug, None)
+        self.suspended[session.slug] = session
+        self._evict()
+
+    def _evict(self):
+        for slug, session in list(self.suspended.items()):
+            if session.poll() != SessionState.SUSPENDED:
+                del self.suspended[slug]
+
+        memory_limit = self.config.suspend_memory_mb * 1024 * 1024 if self.config.suspend_memory_mb else None
+        while self.suspended:
+            total_rss = sum(read_rss_bytes(session.process.pid) or 0 for session in self.suspended.values())
+            if len(self.suspended) <= self.config.suspend_max_games and (memory_limit is None or total_rss <= memory_limit):
+                return
+            oldest = min(self.suspended.values(), key=lambda session: session.suspended_at)
+            del self.suspended[oldest.slug]
+            oldest.kill(f"evicted ({len(self.suspended) + 1} suspended, {total_rss // (1024 * 1024)} MB)")
+
+    def resume(self, slug):
+        session = self.suspended.pop(slug, None)
+        if session is None or session.poll() != SessionState.SUSPENDED:
+            return None
+        return session if session.resume() else None
+
+    def shutdown(self):
+        for session in self.suspended.values():
+            session.kill("launcher exiting")
+        self.suspended.clear()
+
+    def _apply_limits(self, pid):
+        if resource is None or not hasattr(resource, "prlimit"):
+            return
+        limits = []
+        if self.config.address_space_limit_mb:
+            limits.append((resource.RLIMIT_AS, self.config.address_space_limit_mb * 1024 * 1024))
+        if self.config.cpu_time_limit:
+            limits.append((resource.RLIMIT_CPU, self.config.cpu_time_limit))
+
+        for limit, value in limits:
+            try:
+                resource.prlimit(pid, limit, (value, value))
+            except (OSError, ValueError) as error:
+                telemetry.emit("limit_error", pid=pid, limit=limit, error=str(error))
+
+        if self.config.niceness:
+            try:
+                os.setpriority(os.PRIO_PROCESS, pid, self.config.niceness)
+            except OSError as error:
+                telemetry.emit("limit_error", pid=pid, limit="niceness", error=str(error))
+
+    def launch(self, slug, script_path, heartbeat=False):
+        # Only games that opt in through meta.json send heartbeats; the rest start out
+        # RUNNING and are supervised by process exit and RSS alone.
+        session = self.resume(slug)
+        if session is not None:
+            return session
+
+        environment = dict(os.environ)
+        environment.pop(HEARTBEAT_FD_ENV, None)
+        environment.pop(SUSPEND_ENV, None)
+        pass_fds = ()
+        read_fd = write_fd = None
+
+        if heartbeat and HEARTBEAT_SUPPORTED:
+            read_fd, write_fd = os.pipe()
+            os.set_blocking(read_fd, False)
+            environment[HEARTBEAT_FD_ENV] = str(write_fd)
+            pass_fds = (write_fd,)
+            if self.suspend_enabled:
+                environment[SUSPEND_ENV] = "1"
+
+        telemetry.emit("launch", slug=slug)
+        try:
+            process = subprocess.Popen([sys.executable, script_path], env=environment, pass_fds=pass_fds)
+        except Exception:
+            if read_fd is not None:
+                os.close(read_fd)
+            raise
+        finally:
+            if write_fd is not None:
+                os.close(write_fd)
+
+        self._apply_limits(process.pid)
+        return GameSession(slug, process, read_fd, self.config)
+
+
+_heartbeat_fd = None
+_last_heartbeat = 0.0
+_resumed = False
+
+
+def _heartbeat_channel():
+    global _heartbeat_fd
+    if _heartbeat_fd is None:
+        value = os.environ.get(HEARTBEAT_FD_ENV)
+        try:
+            _heartbeat_fd = int(value)
+            os.set_blocking(_heartbeat_fd, False)
+        except (TypeError, ValueError, OSError):
+            _heartbeat_fd = -1
+    return _heartbeat_fd
+
+
+def _write_heartbeat(message):
+    global _heartbeat_fd
+    if _heartbeat_channel() < 0:
+        return False
+    try:
+        os.write(_heartbeat_fd, message)
+    except BlockingIOError:
+        pass
+    except OSError:
+        _heartbeat_fd = -1
+        return False
+    return True
+
+
+def heartbeat(interval=0.5):
+    global _last_heartbeat
+
+    now = time.monotonic()
+    if now - _last_heartbeat < interval:
+        return
+    _last_heartbeat = now
+    _write_heartbeat(b".")
+
+
+def can_suspend():
+    return SUSPEND_SUPPORTED and os.environ.get(SUSPEND_ENV) == "1" and _heartbeat_channel() >= 0
+
+
+def _on_resume(signum, frame):
+    global _resumed
+    _resumed = True
+
+
+def suspend(poll_interval=0.01):
+    # Asks the launcher to stop this process and returns once it has been continued.
+    # SIGCONT may land on any thread, so its handler only sets a flag that the main
+    # thread polls; returns False if the launcher has gone away instead.
+    global _resumed, _last_heartbeat
+    if not can_suspend():
+        return False
+
+    parent_pid = os.getppid()
+    _resumed = False
+    previous_handler = signal.signal(signal.SIGCONT, _on_resume)
+    try:
+        if not _write_heartbeat(SUSPEND_MESSAGE):
+            return False
+        while not _resumed:
+            if os.getppid() != parent_pid:
+                return False
+            time.sleep(poll_interval)
+    finally:
+        signal.signal(signal.SIGCONT, previous_handler)
+
+    _last_heartbeat = 0.0
+    heartbeat()
+    return True
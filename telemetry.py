@@ -0,0 +1,173 @@
+import os
+import sys
+import json
+import time
+import atexit
+import threading
+import traceback
+from collections import deque
+
+DEFAULT_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs")
+
+
+class Telemetry:
+    # emit() only appends to a bounded deque, which is atomic under the GIL, so the
+    # frame path never takes a lock or touches the disk. When the writer falls behind
+    # the oldest events are dropped and the loss is reported in the next batch.
+    def __init__(self, source, tag=None, directory=None, max_events=4096, batch_interval=0.5,
+                 max_file_bytes=1_000_000, backup_count=5, echo=True):
+        self.source = source
+        self.tag = tag or source.upper()
+        self.directory = directory or DEFAULT_DIRECTORY
+        self.events = deque(maxlen=max_events)
+        self.batch_interval = batch_interval
+        self.max_file_bytes = max_file_bytes
+        self.backup_count = backup_count
+        self.echo = echo
+
+        self.dropped = 0
+        self.dropped_reported = 0
+        self.file = None
+        self.running = False
+        self.wake = threading.Event()
+        self.thread = None
+
+    @property
+    def filepath(self):
+        return os.path.join(self.directory, f"{self.source}.jsonl")
+
+    def start(self):
+        if self.running:
+            return
+        self.running = True
+        self.thread = threading.Thread(target=self._run, name=f"telemetry-{self.source}", daemon=True)
+        self.thread.start()
+
+    def stop(self, timeout=2.0):
+        if not self.running:
+            return
+        self.running = False
+        self.wake.set()
+        if self.thread and self.thread is not threading.current_thread():
+            self.thread.join(timeout)
+        self._flush()
+        if self.file:
+            self.file.close()
+            self.file = None
+
+    def emit(self, kind, **fields):
+        if len(self.events) == self.events.maxlen:
+            self.dropped += 1
+        self.events.append((time.time(), kind, fields))
+
+    def _run(self):
+        while self.running:
+            self.wake.wait(self.batch_interval)
+            self.wake.clear()
+            self._flush()
+
+    def _drain(self):
+        batch = []
+        while True:
+            try:
+                batch.append(self.events.popleft())
+            except IndexError:
+                return batch
+
+    def _flush(self):
+        batch = self._drain()
+        dropped = self.dropped - self.dropped_reported
+        if dropped > 0:
+            self.dropped_reported += dropped
+            batch.append((time.time(), "telemetry_dropped", {"count": dropped}))
+        if not batch:
+            return
+
+        lines = []
+        for timestamp, kind, fields in batch:
+            record = {"t": round(timestamp, 4), "src": self.source, "kind": kind}
+            record.update(fields)
+            lines.append(json.dumps(record, default=str))
+
+        try:
+            self._write(lines)
+        except OSError:
+            pass
+
+        if self.echo:
+            try:
+                for _, kind, fields in batch:
+                    details = " ".join(f"{key}={value}" for key, value in fields.items())
+                    sys.stdout.write(f"[{self.tag}] {kind} {details}".rstrip() + "\n")
+                sys.stdout.flush()
+            except (OSError, ValueError):
+                pass
+
+    def _write(self, lines):
+        if self.file is None:
+            os.makedirs(self.directory, exist_ok=True)
+            self.file = open(self.filepath, "a", encoding="utf-8")
+
+        self.file.write("\n".join(lines) + "\n")
+        self.file.flush()
+
+        if self.file.tell() >= self.max_file_bytes:
+            self._rotate()
+
+    def _rotate(self):
+        self.file.close()
+        self.file = None
+
+        for index in range(self.backup_count - 1, 0, -1):
+            older = f"{self.filepath}.{index}"
+            if os.path.exists(older):
+                os.replace(older, f"{self.filepath}.{index + 1}")
+
+        if self.backup_count > 0:
+            os.replace(self.filepath, f"{self.filepath}.1")
+        else:
+            os.remove(self.filepath)
+
+
+_instance = None
+
+
+def start(source, tag=None, **options):
+    global _instance
+    if _instance is not None:
+        return _instance
+
+    options.setdefault("directory", os.environ.get("ARCADE_TELEMETRY_DIR") or None)
+    options.setdefault("echo", os.environ.get("ARCADE_TELEMETRY_ECHO", "1") != "0")
+
+    _instance = Telemetry(source, tag=tag, **options)
+    _instance.start()
+    _instance.emit("session_start", pid=os.getpid())
+
+    started_at = time.monotonic()
+    previous_hook = sys.excepthook
+
+    def report_crash(exc_type, exc_value, exc_traceback):
+        emit("crash", error=exc_type.__name__, message=str(exc_value),
+             traceback="".join(traceback.format_exception(exc_type, exc_value, exc_traceback)))
+        report_session_end()
+        previous_hook(exc_type, exc_value, exc_traceback)
+
+    def report_session_end():
+        atexit.unregister(report_session_end)
+        emit("session_end", duration=round(time.monotonic() - started_at, 3))
+        stop()
+
+    sys.excepthook = report_crash
+    atexit.register(report_session_end)
+    return _instance
+
+
+def emit(kind, **fields):
+    if _instance is not None:
+        _instance.emit(kind, **fields)
+
+
+def stop():
+    if _instance is not None:
+        _instance.stop()